@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraUser:
     account_id: str
     display_name: str
     email: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraProject:
     cloud_id: str
     key: str
@@ -19,7 +19,7 @@ class JiraProject:
     type: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraSprint:
     id: str
     name: str
@@ -29,7 +29,7 @@ class JiraSprint:
     complete_at: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraIssue:
     cloud_id: str
     key: str
@@ -41,13 +41,14 @@ class JiraIssue:
     resolved_at: Optional[str] = None
     assignee: Optional[JiraUser] = None
     reporter: Optional[JiraUser] = None
-    labels: List[str] = field(default_factory=list)
-    components: List[str] = field(default_factory=list)
+    # The mappers store tuples; use list(...) before mutating or comparing with a list.
+    labels: Sequence[str] = ()
+    components: Sequence[str] = ()
     story_points: Optional[float] = None
     sprint_ids: List[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraChangelogItem:
     field: str
     from_value: Optional[str] = None
@@ -56,7 +57,7 @@ class JiraChangelogItem:
     to_string: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraChangelogEvent:
     issue_key: str
     event_id: str
@@ -65,7 +66,7 @@ class JiraChangelogEvent:
     author: Optional[JiraUser] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraWorklog:
     issue_key: str
     worklog_id: str
@@ -76,13 +77,13 @@ class JiraWorklog:
     author: Optional[JiraUser] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpsgenieTeamRef:
     id: str
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CanonicalProjectWithOpsgenieTeams:
     project: JiraProject
     opsgenie_teams: List[OpsgenieTeamRef] = field(default_factory=list)
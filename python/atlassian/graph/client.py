@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Callable, Dict, List, Optional, Tuple
 
 import httpx
 
+from .. import json_codec
 from ..auth import AuthProvider
 from ..errors import (
     GraphQLOperationError,
@@ -18,7 +21,7 @@ from ..errors import (
 from ..logging import get_logger, sanitize_headers
 from ..models import GraphQLErrorItem, GraphQLResult, parse_error_items
 from ..retry import parse_retry_after
-from .throttle import TokenBucket
+from ..throttle import TokenBucket
 
 
 class GraphQLClient:
@@ -33,9 +36,12 @@ class GraphQLClient:
         max_retries_429: int = 2,
         max_wait_seconds: int = 60,
         enable_local_throttling: bool = False,
+        enable_response_cache: bool = False,
+        response_cache_size: int = 128,
         sleeper: Callable[[float], None] | None = None,
         time_provider: Callable[[], datetime] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
     ):
         if not base_url:
             raise ValueError("base_url is required")
@@ -47,6 +53,8 @@ class GraphQLClient:
         self.max_retries_429 = max(0, max_retries_429)
         self.max_wait_seconds = max(0, max_wait_seconds)
         self.enable_local_throttling = enable_local_throttling
+        self.enable_response_cache = enable_response_cache
+        self.response_cache_size = max(1, response_cache_size)
         self._logger = get_logger(logger)
         self._graphql_url = (
             self.base_url
@@ -54,7 +62,11 @@ class GraphQLClient:
             else f"{self.base_url}/graphql"
         )
         self._owns_client = http_client is None
-        self._client = http_client if http_client is not None else httpx.Client(timeout=timeout_seconds)
+        self._client = (
+            http_client
+            if http_client is not None
+            else httpx.Client(timeout=timeout_seconds, http2=http2)
+        )
         self._sleeper = sleeper if sleeper is not None else time.sleep
         self._now = (
             time_provider
@@ -79,6 +91,24 @@ class GraphQLClient:
             ("Accept", "application/json"),
             ("User-Agent", self._user_agent),
         ]
+        # In-memory LRU, lives only as long as this client:
+        # (operationName, experimental APIs, request body hash) -> (ETag, raw response body)
+        self._response_cache: OrderedDict[str, Tuple[str, bytes]] = OrderedDict()
+
+    def _response_cache_key(
+        self,
+        operation_name: Optional[str],
+        experimental_apis: Optional[List[str]],
+        request_body: bytes,
+    ) -> str:
+        betas = ",".join(sorted({beta for beta in experimental_apis or () if beta}))
+        return f"{operation_name or ''}:{betas}:{hashlib.sha256(request_body).hexdigest()}"
+
+    def _store_cached_response(self, cache_key: str, etag: str, content: bytes) -> None:
+        self._response_cache[cache_key] = (etag, content)
+        self._response_cache.move_to_end(cache_key)
+        while len(self._response_cache) > self.response_cache_size:
+            self._response_cache.popitem(last=False)
 
     def _consume_local_budget(self, estimated_cost: float) -> None:
         if self._token_bucket is None:
@@ -137,22 +167,35 @@ class GraphQLClient:
         if operation_name:
             payload["operationName"] = operation_name
 
+        # Encoded once; 429 retries resend the same bytes.
+        request_body = json_codec.dumps_compact(payload)
+
         cost_value = 1 if estimated_cost is None else estimated_cost
         if cost_value < 0:
             cost_value = 0
 
+        cache_key: Optional[str] = None
+        cached: Optional[Tuple[str, bytes]] = None
+        if self.enable_response_cache:
+            cache_key = self._response_cache_key(operation_name, experimental_apis, request_body)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+
         retries = 0
         while True:
             attempt_number = retries + 1
             self._consume_local_budget(cost_value)
             headers = self._build_headers(experimental_apis)
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
             cookies = self.auth.get_cookies() if hasattr(self.auth, "get_cookies") else None
             start = time.perf_counter()
             try:
                 response = self._client.post(
                     self._graphql_url,
                     headers=headers,
-                    json=payload,
+                    content=request_body,
                     cookies=cookies,
                 )
             except httpx.RequestError as exc:
@@ -202,9 +245,7 @@ class GraphQLClient:
                         ) from exc
 
                     computed_wait = (retry_at - self._now()).total_seconds()
-                    wait_seconds = computed_wait
-                    if wait_seconds <= 0:
-                        wait_seconds = 0.0
+                    wait_seconds = max(0.0, computed_wait)
 
                     retry_allowed = retries < self.max_retries_429
                     over_cap = computed_wait > self.max_wait_seconds
@@ -252,10 +293,30 @@ class GraphQLClient:
                         body_snippet=response.text[:200],
                     )
 
+                etag: Optional[str] = None
+                if response.status_code == 304:
+                    if cached is None:
+                        # Nothing to reuse (no conditional request was sent, e.g. a proxy answered 304).
+                        raise TransportError(
+                            status_code=response.status_code,
+                            body_snippet="304 Not Modified without a cached response body",
+                        )
+                    self._logger.debug(
+                        "GraphQL response not modified; using cached body",
+                        extra={"operationName": operation_name, "attempt": attempt_number},
+                    )
+                    content = cached[1]
+                else:
+                    content = response.content
+                    etag = response.headers.get("ETag")
+
                 try:
-                    body = response.json()
+                    body = json_codec.loads(content)
                 except json.JSONDecodeError as exc:
                     raise SerializationError(f"Failed to parse JSON: {exc}") from exc
+                # Only cache bodies that decoded, so a malformed one is never pinned behind its ETag.
+                if cache_key is not None and etag:
+                    self._store_cached_response(cache_key, etag, content)
 
                 data = body.get("data") if isinstance(body, dict) else None
                 errors = (
@@ -1,11 +1,19 @@
 # Code generated by python/tools/generate_jira_project_models.py. DO NOT EDIT.
 from __future__ import annotations
 
+import functools
+import itertools
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING
 
 from atlassian.errors import SerializationError
 
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+    _T = TypeVar("_T")
+
 PAGEINFO_HAS_END_CURSOR = True
 PROJECTS_EDGE_HAS_CURSOR = True
 OPSGENIE_EDGE_HAS_CURSOR = True
@@ -72,110 +80,124 @@ JIRA_PROJECT_OPSGENIE_TEAMS_PAGE_QUERY = """query JiraProjectOpsgenieTeamsPage(
 """
 
 
+_PROJECT_TYPE_RE = re.compile(r"[A-Z][A-Z0-9_]*")
+
+
 def build_jira_projects_page_query(project_types: Sequence[str]) -> str:
     if not project_types:
         raise ValueError("project_types must be non-empty")
-    cleaned: List[str] = []
-    for raw in project_types:
+    raw_types = tuple(project_types)
+    for raw in raw_types:
         if not isinstance(raw, str):
             raise ValueError("project_types must be strings")
+    return _projects_page_query_for(raw_types)
+
+
+@functools.lru_cache(maxsize=32)
+def _projects_page_query_for(raw_types: Tuple[str, ...]) -> str:
+    # Keyed on the caller's raw tokens so repeated calls skip normalization too.
+    cleaned: List[str] = []
+    for raw in raw_types:
         value = raw.strip().upper()
-        if not value or not value.replace("_", "").isalnum() or not value[0].isalpha():
+        if not _PROJECT_TYPE_RE.fullmatch(value):
             raise ValueError(f"invalid Jira project type enum token: {raw!r}")
         cleaned.append(value)
     return JIRA_PROJECTS_PAGE_QUERY_TEMPLATE.replace("__PROJECT_TYPES__", ", ".join(cleaned))
 
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
-    if not isinstance(obj, dict):
-        raise SerializationError(f"Expected object at {path}")
-    return obj
+def _path(path: str, key: Optional[str]) -> str:
+    return path if key is None else f"{path}.{key}"
 
 
-def _expect_list(obj: Any, path: str) -> List[Any]:
-    if not isinstance(obj, list):
-        raise SerializationError(f"Expected list at {path}")
+def _expect_dict(obj: Any, path: str, key: Optional[str] = None) -> Dict[str, Any]:
+    if not isinstance(obj, dict):
+        raise SerializationError(f"Expected object at {_path(path, key)}")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
-    if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {path}")
+def _expect_list(obj: Any, path: str, key: Optional[str] = None) -> List[Any]:
+    if not isinstance(obj, list):
+        raise SerializationError(f"Expected list at {_path(path, key)}")
     return obj
 
 
-def _expect_bool(obj: Any, path: str) -> bool:
-    if not isinstance(obj, bool):
-        raise SerializationError(f"Expected boolean at {path}")
-    return obj
+def _parse_items(parse: Callable[[Any, str], _T], items: List[Any], path: str, key: str) -> List[_T]:
+    # Elements get the unindexed parent path on the happy path; indexed paths
+    # are only built when parsing fails, so the error names the failing element.
+    try:
+        return list(map(parse, items, itertools.repeat(path)))
+    except SerializationError:
+        items_path = _path(path, key)
+        for idx, item in enumerate(items):
+            parse(item, f"{items_path}[{idx}]")
+        raise
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageInfo:
     has_next_page: bool
     end_cursor: Optional[str] = None
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "PageInfo":
-        raw = _expect_dict(obj, path)
-        has_next = _expect_bool(raw.get("hasNextPage"), f"{path}.hasNextPage")
-        end_cursor: Optional[str] = None
-        if PAGEINFO_HAS_END_CURSOR:
-            value = raw.get("endCursor")
-            if value is not None:
-                end_cursor = _expect_str(value, f"{path}.endCursor")
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "PageInfo":
+        raw = _expect_dict(obj, path, key)
+        has_next = raw.get("hasNextPage")
+        if not isinstance(has_next, bool):
+            raise SerializationError(f"Expected boolean at {_path(path, key)}.hasNextPage")
+        end_cursor = raw.get("endCursor")
+        if end_cursor is not None and not isinstance(end_cursor, str):
+            raise SerializationError(f"Expected string at {_path(path, key)}.endCursor")
         return PageInfo(has_next_page=has_next, end_cursor=end_cursor)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpsgenieTeamNode:
     id: str
     name: str
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "OpsgenieTeamNode":
-        raw = _expect_dict(obj, path)
-        return OpsgenieTeamNode(
-            id=_expect_str(raw.get("id"), f"{path}.id"),
-            name=_expect_str(raw.get("name"), f"{path}.name"),
-        )
-
-
-@dataclass(frozen=True)
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "OpsgenieTeamNode":
+        raw = _expect_dict(obj, path, key)
+        team_id = raw.get("id")
+        if not isinstance(team_id, str):
+            raise SerializationError(f"Expected string at {_path(path, key)}.id")
+        name = raw.get("name")
+        if not isinstance(name, str):
+            raise SerializationError(f"Expected string at {_path(path, key)}.name")
+        return OpsgenieTeamNode(id=team_id, name=name)
+
+
+@dataclass(frozen=True, slots=True)
 class OpsgenieTeamEdge:
     cursor: Optional[str]
     node: OpsgenieTeamNode
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "OpsgenieTeamEdge":
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "OpsgenieTeamEdge":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
-        cursor: Optional[str] = None
-        if OPSGENIE_EDGE_HAS_CURSOR:
-            value = raw.get("cursor")
-            if value is not None:
-                cursor = _expect_str(value, f"{path}.cursor")
-        node = OpsgenieTeamNode.from_dict(raw.get("node"), f"{path}.node")
+        cursor = raw.get("cursor")
+        if cursor is not None and not isinstance(cursor, str):
+            raise SerializationError(f"Expected string at {path}.cursor")
+        node = OpsgenieTeamNode.from_dict(raw.get("node"), path, "node")
         return OpsgenieTeamEdge(cursor=cursor, node=node)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpsgenieTeamsConnection:
     page_info: PageInfo
     edges: List[OpsgenieTeamEdge]
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "OpsgenieTeamsConnection":
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "OpsgenieTeamsConnection":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
-        page_info = PageInfo.from_dict(raw.get("pageInfo"), f"{path}.pageInfo")
-        edges_list = _expect_list(raw.get("edges"), f"{path}.edges")
-        edges = [
-            OpsgenieTeamEdge.from_dict(item, f"{path}.edges[{idx}]")
-            for idx, item in enumerate(edges_list)
-        ]
+        page_info = PageInfo.from_dict(raw.get("pageInfo"), path, "pageInfo")
+        edges = _parse_items(OpsgenieTeamEdge.from_dict, _expect_list(raw.get("edges"), path, "edges"), path, "edges")
         return OpsgenieTeamsConnection(page_info=page_info, edges=edges)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraProjectNode:
     id: Optional[str]
     key: str
@@ -183,100 +205,184 @@ class JiraProjectNode:
     opsgenie_teams: OpsgenieTeamsConnection
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "JiraProjectNode":
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "JiraProjectNode":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
-        project_id: Optional[str] = None
-        if PROJECT_HAS_ID:
-            value = raw.get("id")
-            if value is not None:
-                project_id = _expect_str(value, f"{path}.id")
+        project_id = raw.get("id")
+        if project_id is not None and not isinstance(project_id, str):
+            raise SerializationError(f"Expected string at {path}.id")
+        project_key = raw.get("key")
+        if not isinstance(project_key, str):
+            raise SerializationError(f"Expected string at {path}.key")
+        name = raw.get("name")
+        if not isinstance(name, str):
+            raise SerializationError(f"Expected string at {path}.name")
         return JiraProjectNode(
             id=project_id,
-            key=_expect_str(raw.get("key"), f"{path}.key"),
-            name=_expect_str(raw.get("name"), f"{path}.name"),
-            opsgenie_teams=OpsgenieTeamsConnection.from_dict(
-                raw.get("opsgenieTeams"), f"{path}.opsgenieTeams"
-            ),
+            key=project_key,
+            name=name,
+            opsgenie_teams=OpsgenieTeamsConnection.from_dict(raw.get("opsgenieTeams"), path, "opsgenieTeams"),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraProjectEdge:
     cursor: Optional[str]
     node: JiraProjectNode
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "JiraProjectEdge":
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "JiraProjectEdge":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
-        cursor: Optional[str] = None
-        if PROJECTS_EDGE_HAS_CURSOR:
-            value = raw.get("cursor")
-            if value is not None:
-                cursor = _expect_str(value, f"{path}.cursor")
-        node = JiraProjectNode.from_dict(raw.get("node"), f"{path}.node")
+        cursor = raw.get("cursor")
+        if cursor is not None and not isinstance(cursor, str):
+            raise SerializationError(f"Expected string at {path}.cursor")
+        node = JiraProjectNode.from_dict(raw.get("node"), path, "node")
         return JiraProjectEdge(cursor=cursor, node=node)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraProjectsConnection:
     page_info: PageInfo
     edges: List[JiraProjectEdge]
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "JiraProjectsConnection":
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "JiraProjectsConnection":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
-        page_info = PageInfo.from_dict(raw.get("pageInfo"), f"{path}.pageInfo")
-        edges_list = _expect_list(raw.get("edges"), f"{path}.edges")
-        edges = [
-            JiraProjectEdge.from_dict(item, f"{path}.edges[{idx}]")
-            for idx, item in enumerate(edges_list)
-        ]
+        page_info = PageInfo.from_dict(raw.get("pageInfo"), path, "pageInfo")
+        edges = _parse_items(JiraProjectEdge.from_dict, _expect_list(raw.get("edges"), path, "edges"), path, "edges")
         return JiraProjectsConnection(page_info=page_info, edges=edges)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraProjectsPageData:
     projects: JiraProjectsConnection
 
     @staticmethod
-    def from_dict(obj: Any, path: str = "data.jira") -> "JiraProjectsPageData":
+    def from_dict(obj: Any, path: str = "data.jira", key: Optional[str] = None) -> "JiraProjectsPageData":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
         return JiraProjectsPageData(
-            projects=JiraProjectsConnection.from_dict(
-                raw.get("projects"), f"{path}.projects"
-            ),
+            projects=JiraProjectsConnection.from_dict(raw.get("projects"), path, "projects"),
         )
 
 
+class _FastPathMiss(Exception):
+    pass
+
+
+def _page_info_fast(obj: Any) -> PageInfo:
+    if not isinstance(obj, dict):
+        raise _FastPathMiss
+    has_next = obj.get("hasNextPage")
+    if not isinstance(has_next, bool):
+        raise _FastPathMiss
+    end_cursor = obj.get("endCursor")
+    if end_cursor is not None and not isinstance(end_cursor, str):
+        raise _FastPathMiss
+    return PageInfo(has_next_page=has_next, end_cursor=end_cursor)
+
+
+def _parse_jira_projects_page_fast(jira: Any) -> JiraProjectsPageData:
+    # One pass over the page without per-level from_dict calls. Any mismatch
+    # raises _FastPathMiss; the caller re-parses via from_dict for the error path.
+    if not isinstance(jira, dict):
+        raise _FastPathMiss
+    projects = jira.get("projects")
+    if not isinstance(projects, dict):
+        raise _FastPathMiss
+    project_edges = projects.get("edges")
+    if not isinstance(project_edges, list):
+        raise _FastPathMiss
+    edges: List[JiraProjectEdge] = []
+    for edge in project_edges:
+        if not isinstance(edge, dict):
+            raise _FastPathMiss
+        cursor = edge.get("cursor")
+        if cursor is not None and not isinstance(cursor, str):
+            raise _FastPathMiss
+        node = edge.get("node")
+        if not isinstance(node, dict):
+            raise _FastPathMiss
+        node_get = node.get
+        project_id = node_get("id")
+        if project_id is not None and not isinstance(project_id, str):
+            raise _FastPathMiss
+        project_key = node_get("key")
+        name = node_get("name")
+        if not isinstance(project_key, str) or not isinstance(name, str):
+            raise _FastPathMiss
+        teams = node_get("opsgenieTeams")
+        if not isinstance(teams, dict):
+            raise _FastPathMiss
+        team_edges = teams.get("edges")
+        if not isinstance(team_edges, list):
+            raise _FastPathMiss
+        team_page_info = _page_info_fast(teams.get("pageInfo"))
+        parsed_team_edges: List[OpsgenieTeamEdge] = []
+        for team_edge in team_edges:
+            if not isinstance(team_edge, dict):
+                raise _FastPathMiss
+            team_cursor = team_edge.get("cursor")
+            if team_cursor is not None and not isinstance(team_cursor, str):
+                raise _FastPathMiss
+            team = team_edge.get("node")
+            if not isinstance(team, dict):
+                raise _FastPathMiss
+            team_id = team.get("id")
+            team_name = team.get("name")
+            if not isinstance(team_id, str) or not isinstance(team_name, str):
+                raise _FastPathMiss
+            parsed_team_edges.append(
+                OpsgenieTeamEdge(
+                    cursor=team_cursor,
+                    node=OpsgenieTeamNode(id=team_id, name=team_name),
+                )
+            )
+        edges.append(
+            JiraProjectEdge(
+                cursor=cursor,
+                node=JiraProjectNode(
+                    id=project_id,
+                    key=project_key,
+                    name=name,
+                    opsgenie_teams=OpsgenieTeamsConnection(page_info=team_page_info, edges=parsed_team_edges),
+                ),
+            )
+        )
+    page_info = _page_info_fast(projects.get("pageInfo"))
+    return JiraProjectsPageData(projects=JiraProjectsConnection(page_info=page_info, edges=edges))
+
+
 def parse_jira_projects_page(data: Any) -> JiraProjectsPageData:
     root = _expect_dict(data, "data")
     jira = root.get("jira")
     if jira is None:
         raise SerializationError("Missing data.jira")
+    try:
+        return _parse_jira_projects_page_fast(jira)
+    except _FastPathMiss:
+        pass
     return JiraProjectsPageData.from_dict(jira, "data.jira")
 
 
-def parse_project_opsgenie_teams(data: Any) -> OpsgenieTeamsConnection:
-    root = _expect_dict(data, "data")
-    if REFETCH_STRATEGY == "node":
-        project = root.get("project")
-        if project is None:
-            raise SerializationError("Missing data.project")
-        project_obj = _expect_dict(project, "data.project")
-        inner = project_obj.get("opsgenieTeams")
-        if inner is None:
-            raise SerializationError("Missing data.project.opsgenieTeams")
-        return OpsgenieTeamsConnection.from_dict(inner, "data.project.opsgenieTeams")
-
-    jira = root.get("jira")
-    if jira is None:
-        raise SerializationError("Missing data.jira")
-    jira_obj = _expect_dict(jira, "data.jira")
-    project = jira_obj.get("project")
+def _parse_project_opsgenie_teams_slow(data: Any) -> OpsgenieTeamsConnection:
+    # Slow path: walk the response level by level to report the first missing or mistyped object.
+    project = _expect_dict(data, "data").get("project")
     if project is None:
-        raise SerializationError("Missing data.jira.project")
-    project_obj = _expect_dict(project, "data.jira.project")
-    inner = project_obj.get("opsgenieTeams")
+        raise SerializationError("Missing data.project")
+    inner = _expect_dict(project, "data.project").get("opsgenieTeams")
+    if inner is None:
+        raise SerializationError("Missing data.project.opsgenieTeams")
+    return OpsgenieTeamsConnection.from_dict(inner, "data.project", "opsgenieTeams")
+
+
+def parse_project_opsgenie_teams(data: Any) -> OpsgenieTeamsConnection:
+    try:
+        inner = data["project"]["opsgenieTeams"]
+    except (KeyError, TypeError):
+        inner = None
     if inner is None:
-        raise SerializationError("Missing data.jira.project.opsgenieTeams")
-    return OpsgenieTeamsConnection.from_dict(inner, "data.jira.project.opsgenieTeams")
+        return _parse_project_opsgenie_teams_slow(data)
+    return OpsgenieTeamsConnection.from_dict(inner, "data.project", "opsgenieTeams")
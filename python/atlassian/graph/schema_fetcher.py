@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import json
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Union
 
 import httpx
 
+from .. import json_codec
 from ..auth import AuthProvider
 from ..errors import SerializationError
+from ..fileio import write_bytes_if_changed
 from ..models import GraphQLErrorItem
 from .client import GraphQLClient
 
@@ -174,17 +175,18 @@ def fetch_schema_introspection(
     if result.extensions:
         envelope["extensions"] = result.extensions
 
-    introspection_path = out_dir / "schema.introspection.json"
-    introspection_path.write_text(
-        json.dumps(envelope, indent=2, sort_keys=True, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    # Render both artifacts before touching disk so a rendering failure cannot leave
+    # a fresh introspection file next to a stale SDL file.
+    introspection_bytes = json_codec.dumps_pretty(envelope)
+    sdl = _maybe_introspection_to_sdl(envelope)
+    sdl_bytes = (sdl.strip() + "\n").encode("utf-8") if sdl else None
 
+    introspection_path = out_dir / "schema.introspection.json"
+    write_bytes_if_changed(introspection_path, introspection_bytes)
     sdl_path: Optional[Path] = None
-    sdl = _maybe_introspection_to_sdl(envelope)
-    if sdl:
+    if sdl_bytes is not None:
         sdl_path = out_dir / "schema.sdl.graphql"
-        sdl_path.write_text(sdl.strip() + "\n", encoding="utf-8")
+        write_bytes_if_changed(sdl_path, sdl_bytes)
 
     return SchemaFetchResult(
         introspection_json_path=introspection_path,
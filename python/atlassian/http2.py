@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+import importlib.util
+
+
+def http2_available() -> bool:
+    # httpx only speaks HTTP/2 with the optional h2 package (pip install .[http2]).
+    return importlib.util.find_spec("h2") is not None
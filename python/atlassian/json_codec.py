@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:  # optional speedup: pip install atlassian-client[speedups]
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (e.g. NaN/Infinity literals);
+            # let the stdlib decide and raise its own JSONDecodeError.
+            pass
+    return json.loads(data)
+
+
+def dumps_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Deterministic, human-readable JSON: sorted keys, 2-space indent, UTF-8, trailing newline."""
+    # Always the stdlib: these bytes are written to disk, and orjson formats
+    # floats differently (1e20 vs 1e+20), which would make output depend on
+    # whether the speedups extra is installed.
+    return (json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode("utf-8")
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import json
 import threading
+import time
+import warnings
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, MutableMapping, Optional, Sequence
+from datetime import datetime
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Sequence, Tuple
 from urllib.parse import urlencode
 
 import httpx
@@ -193,6 +195,7 @@ class OAuthRefreshTokenAuth:
         timeout_seconds: float = 30.0,
         http_client: httpx.Client | None = None,
         refresh_margin_seconds: int = 60,
+        clock: Callable[[], float] | None = None,
         now: Callable[[], datetime] | None = None,
     ):
         if not client_id or not client_id.strip():
@@ -207,18 +210,32 @@ class OAuthRefreshTokenAuth:
             raise ValueError("timeout_seconds must be > 0")
         if refresh_margin_seconds < 0:
             raise ValueError("refresh_margin_seconds must be >= 0")
+        if now is not None:
+            if clock is not None:
+                raise ValueError("pass clock or now, not both")
+            warnings.warn(
+                "OAuthRefreshTokenAuth(now=...) is deprecated; pass clock= returning seconds instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            wall_clock = now
+
+            def clock() -> float:
+                return wall_clock().timestamp()
 
         self._client_id = client_id.strip()
         self._client_secret = client_secret.strip()
         self._token_url = token_url.strip()
         self._timeout_seconds = timeout_seconds
         self._http_client = http_client
-        self._refresh_margin = timedelta(seconds=refresh_margin_seconds)
-        self._now = now if now is not None else lambda: datetime.now(timezone.utc)
+        self._refresh_margin_seconds = float(refresh_margin_seconds)
+        # Monotonic so wall-clock adjustments (NTP, DST) cannot stretch or cut token lifetimes.
+        self._clock = clock if clock is not None else time.monotonic
 
         self._lock = threading.Lock()
-        self._access_token: Optional[str] = None
-        self._expires_at: Optional[datetime] = None
+        # (access_token, clock reading after which it must be refreshed); swapped as one object
+        # so the lock-free fast path never sees a token paired with another token's deadline.
+        self._cached_token: Optional[Tuple[str, float]] = None
         self._refresh_token = refresh_token.strip()
 
     @property
@@ -234,11 +251,15 @@ class OAuthRefreshTokenAuth:
         return None
 
     def _get_access_token(self) -> str:
+        cached = self._cached_token
+        if cached is not None and self._clock() < cached[1]:
+            return cached[0]
+
         with self._lock:
-            now = self._now()
-            if self._access_token and self._expires_at:
-                if now + self._refresh_margin < self._expires_at:
-                    return self._access_token
+            started = self._clock()
+            cached = self._cached_token
+            if cached is not None and started < cached[1]:
+                return cached[0]
 
             token = refresh_access_token(
                 client_id=self._client_id,
@@ -248,14 +269,16 @@ class OAuthRefreshTokenAuth:
                 timeout_seconds=self._timeout_seconds,
                 http_client=self._http_client,
             )
-            self._access_token = token.access_token
             expires_in = int(token.expires_in) if token.expires_in is not None else 0
             if expires_in < 0:
                 expires_in = 0
-            self._expires_at = now + timedelta(seconds=expires_in)
             if token.refresh_token:
                 self._refresh_token = token.refresh_token.strip()
-            return self._access_token
+            self._cached_token = (
+                token.access_token,
+                started + expires_in - self._refresh_margin_seconds,
+            )
+            return token.access_token
 
 
 def _post_json(
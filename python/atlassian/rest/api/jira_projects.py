@@ -36,7 +36,7 @@ def iter_projects_via_rest(
     if page_size <= 0:
         raise ValueError("page_size must be > 0")
 
-    normalized_types = set(_normalize_project_types(project_types))
+    wanted_types = frozenset(_normalize_project_types(project_types))
     start_at = 0
     seen_start_at: set[int] = set()
 
@@ -54,9 +54,7 @@ def iter_projects_via_rest(
 
         for item in values:
             project: JiraProject = map_rest_project(cloud_id=cloud_id_clean, project=item)
-            if project.type is None:
-                continue
-            if project.type not in normalized_types:
+            if project.type not in wanted_types:
                 continue
             yield CanonicalProjectWithOpsgenieTeams(project=project, opsgenie_teams=[])
 
@@ -7,10 +7,12 @@ from typing import Callable, Dict, Optional, Tuple, Union
 
 import httpx
 
+from .. import json_codec
 from ..auth import AuthProvider
 from ..errors import RateLimitError, SerializationError, TransportError
 from ..logging import get_logger, sanitize_headers
 from ..retry import parse_retry_after
+from ..throttle import TokenBucket
 
 
 class JiraRestClient:
@@ -24,9 +26,11 @@ class JiraRestClient:
         user_agent: Optional[str] = None,
         max_retries_429: int = 2,
         max_wait_seconds: int = 60,
+        local_requests_per_minute: Optional[float] = None,
         sleeper: Callable[[float], None] | None = None,
         time_provider: Callable[[], datetime] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool = False,
     ):
         if not base_url or not base_url.strip():
             raise ValueError("base_url is required")
@@ -34,6 +38,8 @@ class JiraRestClient:
             raise ValueError("auth is required")
         if timeout_seconds is None or timeout_seconds <= 0:
             raise ValueError("timeout_seconds must be > 0")
+        if local_requests_per_minute is not None and local_requests_per_minute <= 0:
+            raise ValueError("local_requests_per_minute must be > 0")
 
         self.base_url = base_url.rstrip("/")
         self.auth = auth
@@ -41,13 +47,27 @@ class JiraRestClient:
         self.max_wait_seconds = max(0, max_wait_seconds)
         self._logger = get_logger(logger)
         self._owns_client = http_client is None
-        self._client = http_client if http_client is not None else httpx.Client(timeout=timeout_seconds)
+        self._client = (
+            http_client
+            if http_client is not None
+            else httpx.Client(timeout=timeout_seconds, http2=http2)
+        )
         self._sleeper = sleeper if sleeper is not None else time.sleep
         self._now = (
             time_provider
             if time_provider is not None
             else lambda: datetime.now(timezone.utc)
         )
+        self._token_bucket = (
+            TokenBucket(
+                capacity=float(local_requests_per_minute),
+                refill_rate_per_sec=float(local_requests_per_minute) / 60.0,
+                now=self._now,
+                sleeper=self._sleeper,
+            )
+            if local_requests_per_minute is not None
+            else None
+        )
         self._user_agent = user_agent or "atlassian-jira-rest-python/0.1.0"
         self._base_headers: list[tuple[str, str]] = [
             ("Accept", "application/json"),
@@ -59,8 +79,17 @@ class JiraRestClient:
         self.auth.apply(headers)
         return headers
 
+    def _consume_local_budget(self, path: str) -> None:
+        if self._token_bucket is None:
+            return
+        wait_time = self._token_bucket.consume(1.0, float(self.max_wait_seconds))
+        self._logger.debug(
+            "Local throttling applied",
+            extra={"path": path, "wait_seconds": round(wait_time, 4)},
+        )
+
     def _parse_retry_after(
-        self, header_value: Optional[str]
+        self, header_value: Optional[str], now: datetime
     ) -> Tuple[datetime, str]:
         if header_value is None:
             raise ValueError("Retry-After header is missing")
@@ -68,10 +97,8 @@ class JiraRestClient:
         if not candidate:
             raise ValueError("Retry-After header is empty")
         if candidate.isdigit():
-            seconds = int(candidate)
-            return self._now() + timedelta(seconds=seconds), "delta-seconds"
-        parsed, label = parse_retry_after(candidate)
-        return parsed, label
+            return now + timedelta(seconds=int(candidate)), "delta-seconds"
+        return parse_retry_after(candidate)
 
     def get_json(
         self,
@@ -87,6 +114,7 @@ class JiraRestClient:
         retries = 0
         while True:
             attempt_number = retries + 1
+            self._consume_local_budget(cleaned_path)
             headers = self._build_headers()
             cookies = self.auth.get_cookies() if hasattr(self.auth, "get_cookies") else None
             start = time.perf_counter()
@@ -111,9 +139,13 @@ class JiraRestClient:
                 )
 
                 if response.status_code == 429:
+                    if self._token_bucket is not None:
+                        # The local budget was too generous; stop bursting and pace from empty.
+                        self._token_bucket.drain()
                     retry_header = response.headers.get("Retry-After")
+                    now = self._now()
                     try:
-                        retry_at, parser_used = self._parse_retry_after(retry_header)
+                        retry_at, parser_used = self._parse_retry_after(retry_header, now)
                         self._logger.debug(
                             "Parsed Retry-After header",
                             extra={
@@ -138,10 +170,8 @@ class JiraRestClient:
                             header_value=retry_header,
                         ) from exc
 
-                    computed_wait = (retry_at - self._now()).total_seconds()
-                    wait_seconds = computed_wait
-                    if wait_seconds <= 0:
-                        wait_seconds = 0.0
+                    computed_wait = (retry_at - now).total_seconds()
+                    wait_seconds = max(0.0, computed_wait)
 
                     retry_allowed = retries < self.max_retries_429
                     over_cap = computed_wait > self.max_wait_seconds
@@ -189,7 +219,7 @@ class JiraRestClient:
                     )
 
                 try:
-                    body = response.json()
+                    body = json_codec.loads(response.content)
                 except json.JSONDecodeError as exc:
                     raise SerializationError(f"Failed to parse JSON: {exc}") from exc
 
@@ -1,11 +1,16 @@
 # Code generated by python/tools/generate_jira_rest_models.py. DO NOT EDIT.
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
+from atlassian import json_codec
 from atlassian.errors import SerializationError
 
+_T = TypeVar("_T")
+
+
 def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
     if not isinstance(obj, dict):
         raise SerializationError(f"Expected object at {path}")
@@ -18,20 +23,22 @@ def _expect_list(obj: Any, path: str) -> List[Any]:
     return obj
 
 
+# JSON decoding only yields exact str/bool/int, so scalar checks compare the
+# type directly; that also keeps bools out of _expect_int.
 def _expect_str(obj: Any, path: str) -> str:
-    if not isinstance(obj, str):
+    if type(obj) is not str:
         raise SerializationError(f"Expected string at {path}")
     return obj
 
 
 def _expect_bool(obj: Any, path: str) -> bool:
-    if not isinstance(obj, bool):
+    if type(obj) is not bool:
         raise SerializationError(f"Expected boolean at {path}")
     return obj
 
 
 def _expect_int(obj: Any, path: str) -> int:
-    if isinstance(obj, bool) or not isinstance(obj, int):
+    if type(obj) is not int:
         raise SerializationError(f"Expected integer at {path}")
     return obj
 
@@ -40,7 +47,58 @@ def _expect_obj(obj: Any, path: str) -> Dict[str, Any]:
     # Jira issue fields are modeled as a free-form object in the OpenAPI spec.
     return _expect_dict(obj, path)
 
-@dataclass(frozen=True)
+
+def _parse_items(parse: Callable[[Any, str], _T], items: List[Any], path: str) -> List[_T]:
+    # Elements get the list path on the happy path; indexed paths are only
+    # built when parsing fails, so the error names the failing element.
+    try:
+        return list(map(parse, items, itertools.repeat(path)))
+    except SerializationError:
+        for idx, item in enumerate(items):
+            parse(item, f"{path}[{idx}]")
+        raise
+
+
+def _import_ijson() -> Any:
+    # Only the streaming parsers need ijson (pip install atlassian-client[codegen]).
+    try:
+        import ijson
+    except ImportError as exc:
+        raise ImportError("Streaming parsing requires ijson: pip install atlassian-client[codegen]") from exc
+    return ijson
+
+
+def _stream_items(
+    fp: IO[bytes],
+    path: str,
+    key: str,
+    scalars: Dict[str, Callable[[Any, str], Any]],
+) -> Iterator[Tuple[Any, str]]:
+    # Yields the elements of the top-level list `key` one at a time, enforcing the
+    # envelope from_dict would: an object whose `key` is a list, null or absent, and
+    # whose scalar fields pass their `scalars` check (null allowed) as they stream by.
+    ijson = _import_ijson()
+    items_path = f"{path}.{key}"
+
+    def events() -> Iterator[Tuple[str, str, Any]]:
+        for prefix, event, value in ijson.parse(fp, use_float=True):
+            if not prefix and event not in ("start_map", "map_key", "end_map"):
+                raise SerializationError(f"Expected object at {path}")
+            if prefix == key and event not in ("start_array", "end_array", "null"):
+                raise SerializationError(f"Expected list at {items_path}")
+            check = scalars.get(prefix)
+            if check is not None and event != "null":
+                # Containers arrive as start_map/start_array with value None and fail the check too.
+                check(value, f"{path}.{prefix}")
+            yield prefix, event, value
+
+    try:
+        for idx, item in enumerate(ijson.items(events(), f"{key}.item")):
+            yield item, f"{items_path}[{idx}]"
+    except ijson.JSONError as exc:
+        raise SerializationError(f"Failed to parse JSON: {exc}") from exc
+
+@dataclass(frozen=True, slots=True)
 class UserDetails:
     account_id: Optional[str]
     display_name: Optional[str]
@@ -49,15 +107,16 @@ class UserDetails:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "UserDetails":
         raw = _expect_dict(obj, path)
-        account_id: Optional[str] = None
-        if raw.get("accountId") is not None:
-            account_id = _expect_str(raw.get("accountId"), f"{path}.accountId")
-        display_name: Optional[str] = None
-        if raw.get("displayName") is not None:
-            display_name = _expect_str(raw.get("displayName"), f"{path}.displayName")
-        email_address: Optional[str] = None
-        if raw.get("emailAddress") is not None:
-            email_address = _expect_str(raw.get("emailAddress"), f"{path}.emailAddress")
+        raw_get = raw.get
+        account_id = raw_get("accountId")
+        if account_id is not None:
+            account_id = _expect_str(account_id, f"{path}.accountId")
+        display_name = raw_get("displayName")
+        if display_name is not None:
+            display_name = _expect_str(display_name, f"{path}.displayName")
+        email_address = raw_get("emailAddress")
+        if email_address is not None:
+            email_address = _expect_str(email_address, f"{path}.emailAddress")
         return UserDetails(
             account_id=account_id,
             display_name=display_name,
@@ -65,7 +124,7 @@ class UserDetails:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Project:
     id: Optional[str]
     key: Optional[str]
@@ -75,18 +134,19 @@ class Project:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "Project":
         raw = _expect_dict(obj, path)
-        project_id: Optional[str] = None
-        if raw.get("id") is not None:
-            project_id = _expect_str(raw.get("id"), f"{path}.id")
-        key: Optional[str] = None
-        if raw.get("key") is not None:
-            key = _expect_str(raw.get("key"), f"{path}.key")
-        name: Optional[str] = None
-        if raw.get("name") is not None:
-            name = _expect_str(raw.get("name"), f"{path}.name")
-        project_type_key: Optional[str] = None
-        if raw.get("projectTypeKey") is not None:
-            project_type_key = _expect_str(raw.get("projectTypeKey"), f"{path}.projectTypeKey")
+        raw_get = raw.get
+        project_id = raw_get("id")
+        if project_id is not None:
+            project_id = _expect_str(project_id, f"{path}.id")
+        key = raw_get("key")
+        if key is not None:
+            key = _expect_str(key, f"{path}.key")
+        name = raw_get("name")
+        if name is not None:
+            name = _expect_str(name, f"{path}.name")
+        project_type_key = raw_get("projectTypeKey")
+        if project_type_key is not None:
+            project_type_key = _expect_str(project_type_key, f"{path}.projectTypeKey")
         return Project(
             id=project_id,
             key=key,
@@ -95,7 +155,7 @@ class Project:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageBeanProject:
     start_at: Optional[int]
     max_results: Optional[int]
@@ -106,24 +166,22 @@ class PageBeanProject:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "PageBeanProject":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{path}.total")
-        is_last: Optional[bool] = None
-        if raw.get("isLast") is not None:
-            is_last = _expect_bool(raw.get("isLast"), f"{path}.isLast")
-        values_raw = raw.get("values")
+        raw_get = raw.get
+        start_at = raw_get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, f"{path}.startAt")
+        max_results = raw_get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, f"{path}.maxResults")
+        total = raw_get("total")
+        if total is not None:
+            total = _expect_int(total, f"{path}.total")
+        is_last = raw_get("isLast")
+        if is_last is not None:
+            is_last = _expect_bool(is_last, f"{path}.isLast")
+        values_raw = raw_get("values")
         values_list = _expect_list(values_raw, f"{path}.values") if values_raw is not None else []
-        values = [
-            Project.from_dict(item, f"{path}.values[{idx}]")
-            for idx, item in enumerate(values_list)
-        ]
+        values = _parse_items(Project.from_dict, values_list, f"{path}.values")
         return PageBeanProject(
             start_at=start_at,
             max_results=max_results,
@@ -132,8 +190,27 @@ class PageBeanProject:
             values=values,
         )
 
+    @staticmethod
+    def from_json_bytes(data: bytes, path: str = "data") -> "PageBeanProject":
+        try:
+            obj = json_codec.loads(data)
+        except ValueError as exc:
+            raise SerializationError(f"Failed to parse JSON: {exc}") from exc
+        return PageBeanProject.from_dict(obj, path)
 
-@dataclass(frozen=True)
+    @staticmethod
+    def iter_values_from_stream(fp: IO[bytes], path: str = "data") -> Iterator[Project]:
+        scalars = {
+            "startAt": _expect_int,
+            "maxResults": _expect_int,
+            "total": _expect_int,
+            "isLast": _expect_bool,
+        }
+        for item, item_path in _stream_items(fp, path, "values", scalars):
+            yield Project.from_dict(item, item_path)
+
+
+@dataclass(frozen=True, slots=True)
 class IssueBean:
     id: Optional[str]
     key: Optional[str]
@@ -142,18 +219,19 @@ class IssueBean:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "IssueBean":
         raw = _expect_dict(obj, path)
-        issue_id: Optional[str] = None
-        if raw.get("id") is not None:
-            issue_id = _expect_str(raw.get("id"), f"{path}.id")
-        key: Optional[str] = None
-        if raw.get("key") is not None:
-            key = _expect_str(raw.get("key"), f"{path}.key")
-        fields_raw = raw.get("fields")
+        raw_get = raw.get
+        issue_id = raw_get("id")
+        if issue_id is not None:
+            issue_id = _expect_str(issue_id, f"{path}.id")
+        key = raw_get("key")
+        if key is not None:
+            key = _expect_str(key, f"{path}.key")
+        fields_raw = raw_get("fields")
         fields = _expect_obj(fields_raw, f"{path}.fields") if fields_raw is not None else {}
         return IssueBean(id=issue_id, key=key, fields=fields)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchResults:
     start_at: Optional[int]
     max_results: Optional[int]
@@ -163,21 +241,19 @@ class SearchResults:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "SearchResults":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{path}.total")
-        issues_raw = raw.get("issues")
+        raw_get = raw.get
+        start_at = raw_get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, f"{path}.startAt")
+        max_results = raw_get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, f"{path}.maxResults")
+        total = raw_get("total")
+        if total is not None:
+            total = _expect_int(total, f"{path}.total")
+        issues_raw = raw_get("issues")
         issues_list = _expect_list(issues_raw, f"{path}.issues") if issues_raw is not None else []
-        issues = [
-            IssueBean.from_dict(item, f"{path}.issues[{idx}]")
-            for idx, item in enumerate(issues_list)
-        ]
+        issues = _parse_items(IssueBean.from_dict, issues_list, f"{path}.issues")
         return SearchResults(
             start_at=start_at,
             max_results=max_results,
@@ -185,8 +261,26 @@ class SearchResults:
             issues=issues,
         )
 
+    @staticmethod
+    def from_json_bytes(data: bytes, path: str = "data") -> "SearchResults":
+        try:
+            obj = json_codec.loads(data)
+        except ValueError as exc:
+            raise SerializationError(f"Failed to parse JSON: {exc}") from exc
+        return SearchResults.from_dict(obj, path)
+
+    @staticmethod
+    def iter_issues_from_stream(fp: IO[bytes], path: str = "data") -> Iterator[IssueBean]:
+        scalars = {
+            "startAt": _expect_int,
+            "maxResults": _expect_int,
+            "total": _expect_int,
+        }
+        for item, item_path in _stream_items(fp, path, "issues", scalars):
+            yield IssueBean.from_dict(item, item_path)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ChangeDetails:
     field: Optional[str]
     from_value: Optional[str] = None
@@ -197,21 +291,22 @@ class ChangeDetails:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "ChangeDetails":
         raw = _expect_dict(obj, path)
-        field: Optional[str] = None
-        if raw.get("field") is not None:
-            field = _expect_str(raw.get("field"), f"{path}.field")
-        from_value: Optional[str] = None
-        if raw.get("from") is not None:
-            from_value = _expect_str(raw.get("from"), f"{path}.from")
-        to_value: Optional[str] = None
-        if raw.get("to") is not None:
-            to_value = _expect_str(raw.get("to"), f"{path}.to")
-        from_string: Optional[str] = None
-        if raw.get("fromString") is not None:
-            from_string = _expect_str(raw.get("fromString"), f"{path}.fromString")
-        to_string: Optional[str] = None
-        if raw.get("toString") is not None:
-            to_string = _expect_str(raw.get("toString"), f"{path}.toString")
+        raw_get = raw.get
+        field = raw_get("field")
+        if field is not None:
+            field = _expect_str(field, f"{path}.field")
+        from_value = raw_get("from")
+        if from_value is not None:
+            from_value = _expect_str(from_value, f"{path}.from")
+        to_value = raw_get("to")
+        if to_value is not None:
+            to_value = _expect_str(to_value, f"{path}.to")
+        from_string = raw_get("fromString")
+        if from_string is not None:
+            from_string = _expect_str(from_string, f"{path}.fromString")
+        to_string = raw_get("toString")
+        if to_string is not None:
+            to_string = _expect_str(to_string, f"{path}.toString")
         return ChangeDetails(
             field=field,
             from_value=from_value,
@@ -221,7 +316,7 @@ class ChangeDetails:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Changelog:
     id: Optional[str]
     created: Optional[str]
@@ -231,21 +326,19 @@ class Changelog:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "Changelog":
         raw = _expect_dict(obj, path)
-        event_id: Optional[str] = None
-        if raw.get("id") is not None:
-            event_id = _expect_str(raw.get("id"), f"{path}.id")
-        created: Optional[str] = None
-        if raw.get("created") is not None:
-            created = _expect_str(raw.get("created"), f"{path}.created")
-        author: Optional[UserDetails] = None
-        if raw.get("author") is not None:
-            author = UserDetails.from_dict(raw.get("author"), f"{path}.author")
-        items_raw = raw.get("items")
+        raw_get = raw.get
+        event_id = raw_get("id")
+        if event_id is not None:
+            event_id = _expect_str(event_id, f"{path}.id")
+        created = raw_get("created")
+        if created is not None:
+            created = _expect_str(created, f"{path}.created")
+        author = raw_get("author")
+        if author is not None:
+            author = UserDetails.from_dict(author, f"{path}.author")
+        items_raw = raw_get("items")
         items_list = _expect_list(items_raw, f"{path}.items") if items_raw is not None else []
-        items = [
-            ChangeDetails.from_dict(item, f"{path}.items[{idx}]")
-            for idx, item in enumerate(items_list)
-        ]
+        items = _parse_items(ChangeDetails.from_dict, items_list, f"{path}.items")
         return Changelog(
             id=event_id,
             created=created,
@@ -254,7 +347,7 @@ class Changelog:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageBeanChangelog:
     start_at: Optional[int]
     max_results: Optional[int]
@@ -265,24 +358,22 @@ class PageBeanChangelog:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "PageBeanChangelog":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{path}.total")
-        is_last: Optional[bool] = None
-        if raw.get("isLast") is not None:
-            is_last = _expect_bool(raw.get("isLast"), f"{path}.isLast")
-        values_raw = raw.get("values")
+        raw_get = raw.get
+        start_at = raw_get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, f"{path}.startAt")
+        max_results = raw_get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, f"{path}.maxResults")
+        total = raw_get("total")
+        if total is not None:
+            total = _expect_int(total, f"{path}.total")
+        is_last = raw_get("isLast")
+        if is_last is not None:
+            is_last = _expect_bool(is_last, f"{path}.isLast")
+        values_raw = raw_get("values")
         values_list = _expect_list(values_raw, f"{path}.values") if values_raw is not None else []
-        values = [
-            Changelog.from_dict(item, f"{path}.values[{idx}]")
-            for idx, item in enumerate(values_list)
-        ]
+        values = _parse_items(Changelog.from_dict, values_list, f"{path}.values")
         return PageBeanChangelog(
             start_at=start_at,
             max_results=max_results,
@@ -291,8 +382,27 @@ class PageBeanChangelog:
             values=values,
         )
 
+    @staticmethod
+    def from_json_bytes(data: bytes, path: str = "data") -> "PageBeanChangelog":
+        try:
+            obj = json_codec.loads(data)
+        except ValueError as exc:
+            raise SerializationError(f"Failed to parse JSON: {exc}") from exc
+        return PageBeanChangelog.from_dict(obj, path)
 
-@dataclass(frozen=True)
+    @staticmethod
+    def iter_values_from_stream(fp: IO[bytes], path: str = "data") -> Iterator[Changelog]:
+        scalars = {
+            "startAt": _expect_int,
+            "maxResults": _expect_int,
+            "total": _expect_int,
+            "isLast": _expect_bool,
+        }
+        for item, item_path in _stream_items(fp, path, "values", scalars):
+            yield Changelog.from_dict(item, item_path)
+
+
+@dataclass(frozen=True, slots=True)
 class Worklog:
     id: Optional[str]
     started: Optional[str]
@@ -304,24 +414,25 @@ class Worklog:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "Worklog":
         raw = _expect_dict(obj, path)
-        worklog_id: Optional[str] = None
-        if raw.get("id") is not None:
-            worklog_id = _expect_str(raw.get("id"), f"{path}.id")
-        started: Optional[str] = None
-        if raw.get("started") is not None:
-            started = _expect_str(raw.get("started"), f"{path}.started")
-        time_spent_seconds: Optional[int] = None
-        if raw.get("timeSpentSeconds") is not None:
-            time_spent_seconds = _expect_int(raw.get("timeSpentSeconds"), f"{path}.timeSpentSeconds")
-        created: Optional[str] = None
-        if raw.get("created") is not None:
-            created = _expect_str(raw.get("created"), f"{path}.created")
-        updated: Optional[str] = None
-        if raw.get("updated") is not None:
-            updated = _expect_str(raw.get("updated"), f"{path}.updated")
-        author: Optional[UserDetails] = None
-        if raw.get("author") is not None:
-            author = UserDetails.from_dict(raw.get("author"), f"{path}.author")
+        raw_get = raw.get
+        worklog_id = raw_get("id")
+        if worklog_id is not None:
+            worklog_id = _expect_str(worklog_id, f"{path}.id")
+        started = raw_get("started")
+        if started is not None:
+            started = _expect_str(started, f"{path}.started")
+        time_spent_seconds = raw_get("timeSpentSeconds")
+        if time_spent_seconds is not None:
+            time_spent_seconds = _expect_int(time_spent_seconds, f"{path}.timeSpentSeconds")
+        created = raw_get("created")
+        if created is not None:
+            created = _expect_str(created, f"{path}.created")
+        updated = raw_get("updated")
+        if updated is not None:
+            updated = _expect_str(updated, f"{path}.updated")
+        author = raw_get("author")
+        if author is not None:
+            author = UserDetails.from_dict(author, f"{path}.author")
         return Worklog(
             id=worklog_id,
             started=started,
@@ -332,7 +443,7 @@ class Worklog:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageOfWorklogs:
     start_at: Optional[int]
     max_results: Optional[int]
@@ -342,21 +453,19 @@ class PageOfWorklogs:
     @staticmethod
     def from_dict(obj: Any, path: str) -> "PageOfWorklogs":
         raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{path}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{path}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{path}.total")
-        worklogs_raw = raw.get("worklogs")
+        raw_get = raw.get
+        start_at = raw_get("startAt")
+        if start_at is not None:
+            start_at = _expect_int(start_at, f"{path}.startAt")
+        max_results = raw_get("maxResults")
+        if max_results is not None:
+            max_results = _expect_int(max_results, f"{path}.maxResults")
+        total = raw_get("total")
+        if total is not None:
+            total = _expect_int(total, f"{path}.total")
+        worklogs_raw = raw_get("worklogs")
         worklogs_list = _expect_list(worklogs_raw, f"{path}.worklogs") if worklogs_raw is not None else []
-        worklogs = [
-            Worklog.from_dict(item, f"{path}.worklogs[{idx}]")
-            for idx, item in enumerate(worklogs_list)
-        ]
+        worklogs = _parse_items(Worklog.from_dict, worklogs_list, f"{path}.worklogs")
         return PageOfWorklogs(
             start_at=start_at,
             max_results=max_results,
@@ -364,3 +473,21 @@ class PageOfWorklogs:
             worklogs=worklogs,
         )
 
+    @staticmethod
+    def from_json_bytes(data: bytes, path: str = "data") -> "PageOfWorklogs":
+        try:
+            obj = json_codec.loads(data)
+        except ValueError as exc:
+            raise SerializationError(f"Failed to parse JSON: {exc}") from exc
+        return PageOfWorklogs.from_dict(obj, path)
+
+    @staticmethod
+    def iter_worklogs_from_stream(fp: IO[bytes], path: str = "data") -> Iterator[Worklog]:
+        scalars = {
+            "startAt": _expect_int,
+            "maxResults": _expect_int,
+            "total": _expect_int,
+        }
+        for item, item_path in _stream_items(fp, path, "worklogs", scalars):
+            yield Worklog.from_dict(item, item_path)
+
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 
 from ...canonical_models import JiraIssue, JiraUser
 from ..gen.jira_api import IssueBean
@@ -27,6 +28,13 @@ def _expect_list(obj: Any, path: str) -> List[Any]:
     return obj
 
 
+def _expect_nested_str(fields: Dict[str, Any], key: str, subkey: str, path: str) -> str:
+    nested = fields.get(key)
+    if not isinstance(nested, dict):
+        raise ValueError(f"Expected object at {path}")
+    return _expect_str(nested.get(subkey), f"{path}.{subkey}")
+
+
 def _maybe_user(obj: Any, path: str) -> Optional[JiraUser]:
     if obj is None:
         return None
@@ -57,14 +65,9 @@ def map_issue(*, cloud_id: str, issue: IssueBean) -> JiraIssue:
     issue_key = _expect_str(issue.key, "issue.key")
     fields = _expect_dict(issue.fields, "issue.fields")
 
-    project = _expect_dict(fields.get("project"), "issue.fields.project")
-    project_key = _expect_str(project.get("key"), "issue.fields.project.key")
-
-    issuetype = _expect_dict(fields.get("issuetype"), "issue.fields.issuetype")
-    issue_type = _expect_str(issuetype.get("name"), "issue.fields.issuetype.name")
-
-    status_obj = _expect_dict(fields.get("status"), "issue.fields.status")
-    status = _expect_str(status_obj.get("name"), "issue.fields.status.name")
+    project_key = _expect_nested_str(fields, "project", "key", "issue.fields.project")
+    issue_type = _expect_nested_str(fields, "issuetype", "name", "issue.fields.issuetype")
+    status = _expect_nested_str(fields, "status", "name", "issue.fields.status")
 
     created_at = _expect_str(fields.get("created"), "issue.fields.created")
     updated_at = _expect_str(fields.get("updated"), "issue.fields.updated")
@@ -77,18 +80,26 @@ def map_issue(*, cloud_id: str, issue: IssueBean) -> JiraIssue:
         if resolutiondate.strip():
             resolved_at = resolutiondate.strip()
 
-    labels: List[str] = []
+    labels: Tuple[str, ...] = ()
     raw_labels = fields.get("labels")
     if raw_labels is not None:
-        for idx, item in enumerate(_expect_list(raw_labels, "issue.fields.labels")):
-            labels.append(_expect_str(item, f"issue.fields.labels[{idx}]"))
+        labels = tuple(
+            sys.intern(_expect_str(item, f"issue.fields.labels[{idx}]"))
+            for idx, item in enumerate(_expect_list(raw_labels, "issue.fields.labels"))
+        )
 
-    components: List[str] = []
+    components: Tuple[str, ...] = ()
     raw_components = fields.get("components")
     if raw_components is not None:
-        for idx, comp in enumerate(_expect_list(raw_components, "issue.fields.components")):
-            comp_obj = _expect_dict(comp, f"issue.fields.components[{idx}]")
-            components.append(_expect_str(comp_obj.get("name"), f"issue.fields.components[{idx}].name"))
+        components = tuple(
+            sys.intern(
+                _expect_str(
+                    _expect_dict(comp, f"issue.fields.components[{idx}]").get("name"),
+                    f"issue.fields.components[{idx}].name",
+                )
+            )
+            for idx, comp in enumerate(_expect_list(raw_components, "issue.fields.components"))
+        )
 
     assignee = _maybe_user(fields.get("assignee"), "issue.fields.assignee")
     reporter = _maybe_user(fields.get("reporter"), "issue.fields.reporter")
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
 from ...canonical_models import JiraProject
 from ..gen.jira_api import Project as RestProject
 
 
+# Jira has a handful of project type keys, so each one is normalized once per process.
+@lru_cache(maxsize=64)
 def _normalize_project_type(value: str) -> str:
     return value.strip().upper().replace("-", "_").replace(" ", "_")
 
@@ -7,21 +7,20 @@ from ..gen.jira_api import UserDetails, Worklog
 
 
 def _require_non_empty(value: Optional[str], path: str) -> str:
-    if not isinstance(value, str) or not value.strip():
+    cleaned = value.strip() if isinstance(value, str) else ""
+    if not cleaned:
         raise ValueError(f"{path} is required")
-    return value.strip()
+    return cleaned
 
 
 def _map_user(user: Optional[UserDetails], path: str) -> Optional[JiraUser]:
     if user is None:
         return None
-    account_id = user.account_id
-    display_name = user.display_name
-    email = user.email_address
+    email = user.email_address.strip() if isinstance(user.email_address, str) else ""
     return JiraUser(
-        account_id=_require_non_empty(account_id, f"{path}.accountId"),
-        display_name=_require_non_empty(display_name, f"{path}.displayName"),
-        email=email.strip() if isinstance(email, str) and email.strip() else None,
+        account_id=_require_non_empty(user.account_id, f"{path}.accountId"),
+        display_name=_require_non_empty(user.display_name, f"{path}.displayName"),
+        email=email or None,
     )
 
 
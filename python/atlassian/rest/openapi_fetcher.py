@@ -2,14 +2,54 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 import httpx
 
+from .. import json_codec
 from ..errors import SerializationError, TransportError
+from ..fileio import write_bytes_if_changed
 
 
 DEFAULT_JIRA_REST_OPENAPI_URL = "https://dac-static.atlassian.com/cloud/jira/platform/swagger-v3.v3.json"
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _meta_path(out_path: Path) -> Path:
+    return out_path.with_name(out_path.name + ".meta")
+
+
+def _conditional_headers(out_path: Path) -> Dict[str, str]:
+    """Validators from the previous download; only trusted while its output still exists."""
+    meta_path = _meta_path(out_path)
+    if not out_path.exists() or not meta_path.exists():
+        return {}
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return {}
+    if not isinstance(meta, dict):
+        return {}
+    headers: Dict[str, str] = {}
+    etag = meta.get("etag")
+    if isinstance(etag, str) and etag:
+        headers["If-None-Match"] = etag
+    last_modified = meta.get("last_modified")
+    if isinstance(last_modified, str) and last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _write_meta(out_path: Path, response: httpx.Response) -> None:
+    meta_path = _meta_path(out_path)
+    meta = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    if not any(meta.values()):
+        meta_path.unlink(missing_ok=True)
+        return
+    write_bytes_if_changed(meta_path, json_codec.dumps_pretty(meta))
 
 
 def fetch_jira_rest_openapi(
@@ -27,32 +67,47 @@ def fetch_jira_rest_openapi(
     out_path = Path(output_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    headers = _conditional_headers(out_path)
+
+    part_path = out_path.with_name(out_path.name + ".part")
     owns_client = http_client is None
     client = http_client if http_client is not None else httpx.Client(timeout=timeout_seconds)
     try:
-        response = client.get(url)
-    except httpx.RequestError as exc:
-        raise TransportError(status_code=0, body_snippet=str(exc)) from exc
+        # Stream straight to disk so the raw spec is never buffered in memory while the
+        # connection is open; it is only parsed (for validation) once fully downloaded.
+        with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and headers:
+                return out_path
+            if response.status_code != 200:
+                response.read()
+                raise TransportError(status_code=response.status_code, body_snippet=response.text[:200])
+            with part_path.open("wb") as fh:
+                for chunk in response.iter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    fh.write(chunk)
+    except BaseException as exc:
+        # Never leave a partial download next to the vendored spec, whatever interrupted it.
+        part_path.unlink(missing_ok=True)
+        if isinstance(exc, httpx.RequestError):
+            raise TransportError(status_code=0, body_snippet=str(exc)) from exc
+        raise
     finally:
         if owns_client:
             client.close()
 
     try:
-        if response.status_code != 200:
-            raise TransportError(status_code=response.status_code, body_snippet=response.text[:200])
-
+        raw = part_path.read_bytes()
         try:
-            payload = response.json()
+            payload = json_codec.loads(raw)
         except json.JSONDecodeError as exc:
             raise SerializationError(f"Failed to parse JSON: {exc}") from exc
+        del raw
 
         if not isinstance(payload, dict):
             raise SerializationError("Expected OpenAPI document to be a JSON object")
 
-        out_path.write_text(
-            json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-        return out_path
+        write_bytes_if_changed(out_path, json_codec.dumps_pretty(payload))
     finally:
-        response.close()
+        part_path.unlink(missing_ok=True)
+
+    _write_meta(out_path, response)
+    return out_path
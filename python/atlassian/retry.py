@@ -2,7 +2,40 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from typing import Tuple
+from typing import Optional, Tuple
+
+
+_IMF_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+def _parse_imf_fixdate(value: str) -> Optional[datetime]:
+    # RFC 7231 IMF-fixdate, the only HTTP-date form servers may generate:
+    # "Sun, 06 Nov 1994 08:49:37 GMT"
+    if (
+        len(value) != 29
+        or not value.endswith(" GMT")
+        or value[3:5] != ", "
+        or value[7] != " "
+        or value[11] != " "
+        or value[16] != " "
+        or value[19] != ":"
+        or value[22] != ":"
+    ):
+        return None
+    month = _IMF_MONTHS.get(value[8:11])
+    day, year = value[5:7], value[12:16]
+    hour, minute, second = value[17:19], value[20:22], value[23:25]
+    if month is None or not (day + year + hour + minute + second).isdigit():
+        return None
+    try:
+        return datetime(
+            int(year), month, int(day), int(hour), int(minute), int(second), tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
 
 
 def parse_retry_after(header_value: str) -> Tuple[datetime, str]:
@@ -12,6 +45,10 @@ def parse_retry_after(header_value: str) -> Tuple[datetime, str]:
     if not candidate:
         raise ValueError("Retry-After header is empty")
 
+    fixdate = _parse_imf_fixdate(candidate)
+    if fixdate is not None:
+        return fixdate, "http-date"
+
     cleaned = candidate
     if cleaned.endswith("Z"):
         cleaned = cleaned[:-1] + "+00:00"
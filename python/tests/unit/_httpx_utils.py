@@ -0,0 +1,18 @@
+import json
+from typing import Any
+
+import httpx
+
+_BODY_JSON_KEY = "tests.body_json"
+
+
+def qp_int(params: httpx.QueryParams, key: str, default: int = 0) -> int:
+    value = params.get(key)
+    return default if value is None else int(value)
+
+
+def body_json(request: httpx.Request) -> Any:
+    """Parse the request body once per request; empty bodies yield {}."""
+    if _BODY_JSON_KEY not in request.extensions:
+        request.extensions[_BODY_JSON_KEY] = json.loads(request.content) if request.content else {}
+    return request.extensions[_BODY_JSON_KEY]
@@ -0,0 +1,31 @@
+from typing import Callable, Dict, List
+
+import httpx
+import pytest
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def routed_transport() -> Callable[[Dict[str, List[Handler]]], httpx.MockTransport]:
+    """Build a MockTransport that dispatches on the exact URL path.
+
+    Each path maps to handlers served in call order; the last handler keeps answering
+    once the list is exhausted. Unknown paths fail the test.
+    """
+
+    def build(routes: Dict[str, List[Handler]]) -> httpx.MockTransport:
+        counters = dict.fromkeys(routes, 0)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            handlers = routes.get(path)
+            if not handlers:
+                raise AssertionError(f"unexpected request path: {path}")
+            idx = counters[path]
+            counters[path] = idx + 1
+            return handlers[min(idx, len(handlers) - 1)](request)
+
+        return httpx.MockTransport(handler)
+
+    return build
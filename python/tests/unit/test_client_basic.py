@@ -221,3 +221,117 @@ def test_invalid_json_raises_serialization_error():
         )
         with pytest.raises(SerializationError):
             client.execute("query { ok }")
+
+
+def test_response_cache_reuses_body_on_304():
+    seen_if_none_match: list = []
+
+    def handler(request: httpx.Request):
+        seen_if_none_match.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"abc"':
+            return httpx.Response(304, request=request)
+        return httpx.Response(200, json={"data": {"ok": True}}, headers={"ETag": '"abc"'}, request=request)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = GraphQLClient(
+            "https://api.atlassian.com",
+            auth=OAuthBearerAuth(lambda: "token"),
+            enable_response_cache=True,
+            http_client=http_client,
+        )
+        first = client.execute("query { ok }", operation_name="Ok")
+        second = client.execute("query { ok }", operation_name="Ok")
+
+    assert first.data == second.data == {"ok": True}
+    assert seen_if_none_match == [None, '"abc"']
+
+
+def test_response_cache_is_keyed_by_experimental_apis():
+    seen_if_none_match: list = []
+
+    def handler(request: httpx.Request):
+        seen_if_none_match.append(request.headers.get("If-None-Match"))
+        betas = ",".join(request.headers.get_list("X-ExperimentalApi"))
+        if request.headers.get("If-None-Match") == f'"{betas}"':
+            return httpx.Response(304, request=request)
+        return httpx.Response(200, json={"data": {"betas": betas}}, headers={"ETag": f'"{betas}"'}, request=request)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = GraphQLClient(
+            "https://api.atlassian.com",
+            auth=OAuthBearerAuth(lambda: "token"),
+            enable_response_cache=True,
+            http_client=http_client,
+        )
+        first = client.execute("query { ok }", operation_name="Ok", experimental_apis=["a"])
+        second = client.execute("query { ok }", operation_name="Ok", experimental_apis=["b"])
+        third = client.execute("query { ok }", operation_name="Ok", experimental_apis=["a"])
+
+    assert [first.data, second.data, third.data] == [{"betas": "a"}, {"betas": "b"}, {"betas": "a"}]
+    assert seen_if_none_match == [None, None, '"a"']
+
+
+def test_response_cache_evicts_least_recently_used():
+    seen_if_none_match: list = []
+
+    def handler(request: httpx.Request):
+        seen_if_none_match.append(request.headers.get("If-None-Match"))
+        return httpx.Response(200, json={"data": {"ok": True}}, headers={"ETag": '"v"'}, request=request)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = GraphQLClient(
+            "https://api.atlassian.com",
+            auth=OAuthBearerAuth(lambda: "token"),
+            enable_response_cache=True,
+            response_cache_size=2,
+            http_client=http_client,
+        )
+        for name in ("A", "B", "A", "C", "B", "A"):
+            client.execute("query { ok }", operation_name=name)
+
+    # A and B are cached; touching A keeps it, so C evicts B; then B evicts A.
+    assert seen_if_none_match == [None, None, '"v"', None, None, None]
+
+
+def test_304_without_cached_body_raises_transport_error():
+    def handler(request: httpx.Request):
+        return httpx.Response(304, request=request)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = GraphQLClient(
+            "https://api.atlassian.com",
+            auth=OAuthBearerAuth(lambda: "token"),
+            enable_response_cache=True,
+            http_client=http_client,
+        )
+        with pytest.raises(TransportError) as excinfo:
+            client.execute("query { ok }", operation_name="Ok")
+    assert excinfo.value.status_code == 304
+
+
+def test_response_cache_skips_undecodable_bodies():
+    seen_if_none_match: list = []
+    bodies = [b"not-json", b'{"data": {"ok": true}}']
+
+    def handler(request: httpx.Request):
+        seen_if_none_match.append(request.headers.get("If-None-Match"))
+        return httpx.Response(200, content=bodies.pop(0), headers={"ETag": '"v"'}, request=request)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = GraphQLClient(
+            "https://api.atlassian.com",
+            auth=OAuthBearerAuth(lambda: "token"),
+            enable_response_cache=True,
+            http_client=http_client,
+        )
+        with pytest.raises(SerializationError):
+            client.execute("query { ok }", operation_name="Ok")
+        result = client.execute("query { ok }", operation_name="Ok")
+
+    assert result.data == {"ok": True}
+    assert seen_if_none_match == [None, None]
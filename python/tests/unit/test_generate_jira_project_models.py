@@ -0,0 +1,41 @@
+import importlib.util
+import os
+import sys
+import time
+from pathlib import Path
+
+from atlassian.fileio import write_bytes_if_changed
+
+_TOOL_PATH = Path(__file__).resolve().parents[2] / "tools" / "generate_jira_project_models.py"
+
+
+def _load_tool(monkeypatch):
+    spec = importlib.util.spec_from_file_location("generate_jira_project_models", _TOOL_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses resolve annotations through sys.modules.
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_schema_ttl_restarts_after_unchanged_refetch(tmp_path: Path, monkeypatch):
+    tool = _load_tool(monkeypatch)
+    schema_path = tmp_path / "schema.introspection.json"
+    schema_path.write_bytes(b'{"data": {"__schema": {}}}\n')
+    old = time.time() - 3600
+    os.utime(schema_path, (old, old))
+
+    fetches: list[str] = []
+
+    def fake_fetch(base_url, auth, *, output_dir, experimental_apis):
+        fetches.append(base_url)
+        # Upstream has not changed: the fetcher leaves the bytes (and mtime) alone.
+        write_bytes_if_changed(output_dir / "schema.introspection.json", schema_path.read_bytes())
+
+    monkeypatch.setattr(tool, "fetch_schema_introspection", fake_fetch)
+
+    for _ in range(2):
+        if tool._schema_needs_fetch(schema_path, ttl_seconds=60):
+            tool._fetch_schema(schema_path, "https://example.invalid", auth=None)
+
+    assert fetches == ["https://example.invalid"]
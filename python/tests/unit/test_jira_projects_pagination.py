@@ -1,12 +1,14 @@
-import json
-
 import httpx
+import pytest
 
 from atlassian.auth import OAuthBearerAuth
+from atlassian.errors import SerializationError
 from atlassian.graph.api.jira_projects import iter_projects_with_opsgenie_linkable_teams
 from atlassian.graph.client import GraphQLClient
 from atlassian.graph.gen import jira_projects_api as api
 
+from _httpx_utils import body_json
+
 
 def _resp(request: httpx.Request, payload: dict, status_code: int = 200, headers: dict | None = None) -> httpx.Response:
     return httpx.Response(
@@ -21,7 +23,7 @@ def test_jira_projects_pagination_outer_and_nested():
     calls: list[dict] = []
 
     def handler(request: httpx.Request) -> httpx.Response:
-        body = json.loads(request.content.decode("utf-8"))
+        body = body_json(request)
         op = body.get("operationName")
         vars = body.get("variables") or {}
         calls.append({"op": op, "vars": vars})
@@ -193,3 +195,49 @@ def test_jira_projects_pagination_outer_and_nested():
         "JiraProjectOpsgenieTeamsPage",
         "JiraProjectsPage",
     ]
+
+
+def test_parse_jira_projects_page_error_names_failing_edge():
+    def team(name):
+        return {"cursor": "c", "node": {"id": "t", "name": name}}
+
+    page = {
+        "jira": {
+            "projects": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "edges": [
+                    {
+                        "cursor": "pc1",
+                        "node": {
+                            "id": "projA",
+                            "key": "A",
+                            "name": "Project A",
+                            "opsgenieTeams": {
+                                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                                "edges": [team("Team 1"), team(None)],
+                            },
+                        },
+                    }
+                ],
+            }
+        }
+    }
+
+    with pytest.raises(SerializationError) as excinfo:
+        api.parse_jira_projects_page(page)
+    assert str(excinfo.value) == (
+        "Expected string at data.jira.projects.edges[0].node.opsgenieTeams.edges[1].node.name"
+    )
+
+
+@pytest.mark.parametrize("token", ["", "1SOFTWARE", "SOFT-WARE", "SOFTWAREÉ"])
+def test_build_jira_projects_page_query_rejects_invalid_enum_tokens(token):
+    with pytest.raises(ValueError):
+        api.build_jira_projects_page_query([token])
+
+
+def test_build_jira_projects_page_query_normalizes_tokens():
+    query = api.build_jira_projects_page_query([" software ", "service_desk"])
+    assert "types: [SOFTWARE, SERVICE_DESK]" in query
+    assert api.build_jira_projects_page_query(["SOFTWARE", "SERVICE_DESK"]) == query
+    assert api.build_jira_projects_page_query([" software ", "service_desk"]) is query
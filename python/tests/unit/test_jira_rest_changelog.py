@@ -4,11 +4,13 @@ from atlassian.auth import OAuthBearerAuth
 from atlassian.rest.api.jira_changelog import iter_issue_changelog_via_rest
 from atlassian.rest.client import JiraRestClient
 
+from _httpx_utils import qp_int
+
 
 def test_jira_rest_changelog_pagination_and_mapping():
     def handler(request: httpx.Request) -> httpx.Response:
         assert request.url.path.endswith("/rest/api/3/issue/A-1/changelog")
-        start_at = int(request.url.params.get("startAt", "0"))
+        start_at = qp_int(request.url.params, "startAt")
         if start_at == 0:
             return httpx.Response(
                 200,
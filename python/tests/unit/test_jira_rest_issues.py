@@ -5,11 +5,13 @@ from atlassian.auth import OAuthBearerAuth
 from atlassian.rest.api.jira_issues import iter_issues_via_rest
 from atlassian.rest.client import JiraRestClient
 
+from _httpx_utils import qp_int
+
 
 def test_jira_rest_issues_pagination_and_mapping():
     def handler(request: httpx.Request) -> httpx.Response:
         assert request.url.path.endswith("/rest/api/3/search")
-        start_at = int(request.url.params.get("startAt", "0"))
+        start_at = qp_int(request.url.params, "startAt")
         assert request.url.params.get("jql")
         assert request.url.params.get("fields")
         if start_at == 0:
@@ -98,8 +100,8 @@ def test_jira_rest_issues_pagination_and_mapping():
     assert issues[0].project_key == "A"
     assert issues[0].issue_type == "Bug"
     assert issues[0].status == "Done"
-    assert issues[0].labels == ["l1"]
-    assert issues[0].components == ["Comp1"]
+    assert issues[0].labels == ("l1",)
+    assert issues[0].components == ("Comp1",)
     assert issues[1].assignee and issues[1].assignee.account_id == "u1"
     assert issues[2].resolved_at == "2021-01-07T00:00:00.000+0000"
 
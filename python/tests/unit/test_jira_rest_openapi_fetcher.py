@@ -1,7 +1,10 @@
+import json
 from pathlib import Path
 
 import httpx
+import pytest
 
+from atlassian.errors import SerializationError, TransportError
 from atlassian.rest.openapi_fetcher import fetch_jira_rest_openapi
 
 
@@ -25,3 +28,86 @@ def test_fetch_jira_rest_openapi_writes_pretty_json(tmp_path: Path):
     text = out_path.read_text(encoding="utf-8")
     assert text.endswith("\n")
     assert '"openapi": "3.0.1"' in text
+
+
+def test_fetch_jira_rest_openapi_reuses_file_on_304(tmp_path: Path):
+    sample = {"openapi": "3.0.1", "info": {"title": "Jira", "version": "x"}}
+    seen: list = []
+    last_modified = "Mon, 10 May 2021 11:00:00 GMT"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.headers.get("If-None-Match"), request.headers.get("If-Modified-Since")))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, request=request)
+        return httpx.Response(
+            200,
+            json=sample,
+            headers={"ETag": '"v1"', "Last-Modified": last_modified},
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    out_path = tmp_path / "swagger.json"
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        fetch_jira_rest_openapi(url="https://example/swagger.json", output_path=out_path, http_client=http_client)
+        first = out_path.read_text(encoding="utf-8")
+        written = fetch_jira_rest_openapi(
+            url="https://example/swagger.json",
+            output_path=out_path,
+            http_client=http_client,
+        )
+
+    assert written == out_path
+    assert seen == [(None, None), ('"v1"', last_modified)]
+    assert out_path.read_text(encoding="utf-8") == first
+    meta = json.loads((tmp_path / "swagger.json.meta").read_text(encoding="utf-8"))
+    assert meta == {"etag": '"v1"', "last_modified": last_modified}
+
+
+def test_fetch_jira_rest_openapi_keeps_previous_file_on_invalid_json(tmp_path: Path):
+    out_path = tmp_path / "swagger.json"
+    out_path.write_text('{"openapi": "old"}\n', encoding="utf-8")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b'{"openapi": ', request=request)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        with pytest.raises(SerializationError):
+            fetch_jira_rest_openapi(url="https://example/swagger.json", output_path=out_path, http_client=http_client)
+
+    assert out_path.read_text(encoding="utf-8") == '{"openapi": "old"}\n'
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["swagger.json"]
+
+
+class _InterruptedStream(httpx.SyncByteStream):
+    def __init__(self, exc: BaseException):
+        self._exc = exc
+
+    def __iter__(self):
+        yield b'{"openapi": '
+        raise self._exc
+
+
+@pytest.mark.parametrize(
+    ("exc", "expected"),
+    [
+        (httpx.ReadError("connection reset"), TransportError),
+        (OSError("disk full"), OSError),
+        (KeyboardInterrupt(), KeyboardInterrupt),
+    ],
+)
+def test_fetch_jira_rest_openapi_removes_part_file_on_interrupted_download(tmp_path: Path, exc, expected):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=_InterruptedStream(exc), request=request)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        with pytest.raises(expected):
+            fetch_jira_rest_openapi(
+                url="https://example/swagger.json",
+                output_path=tmp_path / "swagger.json",
+                http_client=http_client,
+            )
+
+    assert list(tmp_path.iterdir()) == []
@@ -1,57 +1,50 @@
+import io
 from datetime import datetime, timedelta, timezone
 
 import httpx
 import pytest
 
 from atlassian.auth import OAuthBearerAuth
+from atlassian.errors import SerializationError
 from atlassian.rest.api.jira_projects import iter_projects_via_rest
 from atlassian.rest.client import JiraRestClient
+from atlassian.rest.gen.jira_api import PageBeanProject
 
+from _httpx_utils import qp_int
 
-def test_jira_rest_projects_pagination_and_type_filtering():
-    calls: list[int] = []
-
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.headers.get("Authorization") == "Bearer token"
-        assert request.url.path.endswith("/rest/api/3/project/search")
 
-        start_at = int(request.url.params.get("startAt", "0"))
-        max_results = int(request.url.params.get("maxResults", "0"))
-        assert max_results == 2
-        calls.append(start_at)
+def test_jira_rest_projects_pagination_and_type_filtering(routed_transport):
+    calls: list[int] = []
 
-        if start_at == 0:
+    def page(start_at: int, is_last: bool, values: list):
+        def respond(request: httpx.Request) -> httpx.Response:
+            assert request.headers.get("Authorization") == "Bearer token"
+            assert qp_int(request.url.params, "maxResults") == 2
+            assert qp_int(request.url.params, "startAt") == start_at
+            calls.append(start_at)
             return httpx.Response(
                 200,
-                json={
-                    "startAt": 0,
-                    "maxResults": 2,
-                    "total": 3,
-                    "isLast": False,
-                    "values": [
-                        {"key": "A", "name": " Project A ", "projectTypeKey": "software"},
-                        {"key": "B", "name": "Project B", "projectTypeKey": "business"},
-                    ],
-                },
+                json={"startAt": start_at, "maxResults": 2, "total": 3, "isLast": is_last, "values": values},
                 request=request,
             )
-        if start_at == 2:
-            return httpx.Response(
-                200,
-                json={
-                    "startAt": 2,
-                    "maxResults": 2,
-                    "total": 3,
-                    "isLast": True,
-                    "values": [
-                        {"key": "C", "name": "Project C", "projectTypeKey": "software"},
-                    ],
-                },
-                request=request,
-            )
-        raise AssertionError(f"unexpected startAt={start_at}")
 
-    transport = httpx.MockTransport(handler)
+        return respond
+
+    transport = routed_transport(
+        {
+            "/ex/jira/cloud-123/rest/api/3/project/search": [
+                page(
+                    0,
+                    False,
+                    [
+                        {"key": "A", "name": " Project A ", "projectTypeKey": "software"},
+                        {"key": "B", "name": "Project B", "projectTypeKey": "business"},
+                    ],
+                ),
+                page(2, True, [{"key": "C", "name": "Project C", "projectTypeKey": "software"}]),
+            ]
+        }
+    )
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
@@ -125,3 +118,157 @@ def test_iter_projects_via_rest_requires_cloud_id():
         )
         with pytest.raises(ValueError):
             list(iter_projects_via_rest(client, cloud_id=" ", project_types=["SOFTWARE"], page_size=1))
+
+
+def test_iter_projects_via_rest_streams_pages_lazily():
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start_at = qp_int(request.url.params, "startAt")
+        calls.append(start_at)
+        return httpx.Response(
+            200,
+            json={
+                "startAt": start_at,
+                "maxResults": 1,
+                "total": 3,
+                "isLast": start_at == 2,
+                "values": [{"key": f"P{start_at}", "name": "Project", "projectTypeKey": "software"}],
+            },
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = JiraRestClient(
+            "https://api.atlassian.com/ex/jira/cloud-123",
+            auth=OAuthBearerAuth(lambda: "token"),
+            http_client=http_client,
+        )
+        it = iter_projects_via_rest(client, cloud_id="cloud-123", project_types=["SOFTWARE"], page_size=1)
+        assert calls == []
+        assert next(it).project.key == "P0"
+        assert calls == [0]
+        assert [r.project.key for r in it] == ["P1", "P2"]
+        assert calls == [0, 1, 2]
+
+
+def test_jira_rest_client_local_throttling_paces_requests():
+    now = datetime(2021, 5, 10, 10, 0, 0, tzinfo=timezone.utc)
+    current = {"now": now}
+
+    def now_fn():
+        return current["now"]
+
+    slept: list[float] = []
+
+    def sleeper(seconds: float) -> None:
+        slept.append(seconds)
+        current["now"] = current["now"] + timedelta(seconds=seconds)
+
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"isLast": True, "total": 0, "values": []}, request=request)
+    )
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = JiraRestClient(
+            "https://api.atlassian.com/ex/jira/cloud-123",
+            auth=OAuthBearerAuth(lambda: "token"),
+            local_requests_per_minute=2,
+            max_wait_seconds=60,
+            time_provider=now_fn,
+            sleeper=sleeper,
+            http_client=http_client,
+        )
+        for _ in range(3):
+            client.get_json("/rest/api/3/project/search")
+
+    assert slept == [pytest.approx(30.0)]
+
+
+def test_page_bean_project_from_json_bytes():
+    page = PageBeanProject.from_json_bytes(
+        b'{"startAt": 0, "maxResults": 1, "total": 1, "isLast": true,'
+        b' "values": [{"id": "1", "key": "ONE", "name": "One", "projectTypeKey": "software"}]}'
+    )
+    assert page.is_last is True
+    assert [project.key for project in page.values] == ["ONE"]
+
+    with pytest.raises(SerializationError):
+        PageBeanProject.from_json_bytes(b'{"values": ')
+    with pytest.raises(SerializationError, match=r"data\.values"):
+        PageBeanProject.from_json_bytes(b'{"values": {}}')
+
+
+def test_page_bean_project_error_names_failing_element():
+    with pytest.raises(SerializationError, match=r"data\.values\[1\]\.id"):
+        PageBeanProject.from_json_bytes(b'{"values": [{"id": "1"}, {"id": 2}]}')
+
+
+def test_page_bean_project_iter_values_from_stream():
+    pytest.importorskip("ijson")
+    body = (
+        b'{"startAt": 0, "isLast": true, "values": ['
+        b'{"id": "1", "key": "ONE", "name": "One", "projectTypeKey": "software"},'
+        b'{"id": "2", "key": "TWO", "name": "Two", "projectTypeKey": "business"}]}'
+    )
+    projects = PageBeanProject.iter_values_from_stream(io.BytesIO(body))
+    assert [project.key for project in projects] == ["ONE", "TWO"]
+
+    with pytest.raises(SerializationError, match=r"data\.values\[1\]\.id"):
+        list(PageBeanProject.iter_values_from_stream(io.BytesIO(b'{"values": [{"id": "1"}, {"id": 2}]}')))
+    with pytest.raises(SerializationError, match=r"Expected list at data\.values"):
+        list(PageBeanProject.iter_values_from_stream(io.BytesIO(b'{"values": {}}')))
+    with pytest.raises(SerializationError):
+        list(PageBeanProject.iter_values_from_stream(io.BytesIO(b'{"values": [')))
+
+
+def test_jira_rest_client_drains_local_bucket_on_429(routed_transport):
+    current = {"now": datetime(2021, 5, 10, 10, 0, 0, tzinfo=timezone.utc)}
+
+    def now_fn():
+        return current["now"]
+
+    slept: list[float] = []
+
+    def sleeper(seconds: float) -> None:
+        slept.append(seconds)
+        current["now"] = current["now"] + timedelta(seconds=seconds)
+
+    transport = routed_transport(
+        {
+            "/ex/jira/cloud-123/rest/api/3/project/search": [
+                lambda request: httpx.Response(429, headers={"Retry-After": "0"}, request=request),
+                lambda request: httpx.Response(200, json={"isLast": True, "values": []}, request=request),
+            ]
+        }
+    )
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        client = JiraRestClient(
+            "https://api.atlassian.com/ex/jira/cloud-123",
+            auth=OAuthBearerAuth(lambda: "token"),
+            local_requests_per_minute=60,
+            max_retries_429=1,
+            time_provider=now_fn,
+            sleeper=sleeper,
+            http_client=http_client,
+        )
+        client.get_json("/rest/api/3/project/search")
+
+    # A full 60-request burst was available; after the 429 the retry waits for a fresh token.
+    assert slept[-1] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    ("body", "message"),
+    [
+        (b'{"total": "x", "values": []}', r"Expected integer at data\.total"),
+        (b'{"isLast": 1, "values": []}', r"Expected boolean at data\.isLast"),
+        (b'{"values": [], "startAt": {}}', r"Expected integer at data\.startAt"),
+    ],
+)
+def test_page_bean_project_stream_checks_envelope_scalars(body, message):
+    pytest.importorskip("ijson")
+    with pytest.raises(SerializationError, match=message):
+        list(PageBeanProject.iter_values_from_stream(io.BytesIO(body)))
+    with pytest.raises(SerializationError, match=message):
+        PageBeanProject.from_json_bytes(body)
@@ -4,53 +4,48 @@ from atlassian.auth import OAuthBearerAuth
 from atlassian.rest.api.jira_worklogs import iter_issue_worklogs_via_rest
 from atlassian.rest.client import JiraRestClient
 
+from _httpx_utils import qp_int
 
-def test_jira_rest_worklogs_pagination_and_mapping():
-    def handler(request: httpx.Request) -> httpx.Response:
-        assert request.url.path.endswith("/rest/api/3/issue/A-1/worklog")
-        start_at = int(request.url.params.get("startAt", "0"))
-        if start_at == 0:
-            return httpx.Response(
-                200,
-                json={
-                    "startAt": 0,
-                    "maxResults": 1,
-                    "total": 2,
-                    "worklogs": [
-                        {
-                            "id": "200",
-                            "author": {"accountId": "u1", "displayName": "User 1"},
-                            "started": "2021-01-02T00:00:00.000+0000",
-                            "timeSpentSeconds": 60,
-                            "created": "2021-01-02T00:00:00.000+0000",
-                            "updated": "2021-01-02T00:00:00.000+0000",
-                        }
-                    ],
-                },
-                request=request,
-            )
-        if start_at == 1:
+
+def test_jira_rest_worklogs_pagination_and_mapping(routed_transport):
+    def page(start_at: int, worklog: dict):
+        def respond(request: httpx.Request) -> httpx.Response:
+            assert qp_int(request.url.params, "startAt") == start_at
             return httpx.Response(
                 200,
-                json={
-                    "startAt": 1,
-                    "maxResults": 1,
-                    "total": 2,
-                    "worklogs": [
-                        {
-                            "id": "201",
-                            "started": "2021-01-03T00:00:00.000+0000",
-                            "timeSpentSeconds": 120,
-                            "created": "2021-01-03T00:00:00.000+0000",
-                            "updated": "2021-01-03T00:00:00.000+0000",
-                        }
-                    ],
-                },
+                json={"startAt": start_at, "maxResults": 1, "total": 2, "worklogs": [worklog]},
                 request=request,
             )
-        raise AssertionError(f"unexpected startAt={start_at}")
 
-    transport = httpx.MockTransport(handler)
+        return respond
+
+    transport = routed_transport(
+        {
+            "/ex/jira/cloud-123/rest/api/3/issue/A-1/worklog": [
+                page(
+                    0,
+                    {
+                        "id": "200",
+                        "author": {"accountId": "u1", "displayName": "User 1"},
+                        "started": "2021-01-02T00:00:00.000+0000",
+                        "timeSpentSeconds": 60,
+                        "created": "2021-01-02T00:00:00.000+0000",
+                        "updated": "2021-01-02T00:00:00.000+0000",
+                    },
+                ),
+                page(
+                    1,
+                    {
+                        "id": "201",
+                        "started": "2021-01-03T00:00:00.000+0000",
+                        "timeSpentSeconds": 120,
+                        "created": "2021-01-03T00:00:00.000+0000",
+                        "updated": "2021-01-03T00:00:00.000+0000",
+                    },
+                ),
+            ]
+        }
+    )
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         client = JiraRestClient(
             "https://api.atlassian.com/ex/jira/cloud-123",
@@ -65,3 +60,4 @@ def test_jira_rest_worklogs_pagination_and_mapping():
     assert worklogs[0].time_spent_seconds == 60
     assert worklogs[0].author and worklogs[0].author.account_id == "u1"
     assert worklogs[1].author is None
+    assert not hasattr(worklogs[0], "__dict__")
@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from atlassian import json_codec
+
+
+def test_dumps_pretty_matches_stdlib_layout():
+    payload = {"b": [1, 2, {"z": None, "a": True}], "a": "café", "empty": {}, "list": []}
+
+    expected = (json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode("utf-8")
+    assert json_codec.dumps_pretty(payload) == expected
+
+
+def test_dumps_pretty_formats_floats_like_stdlib():
+    payload = {"big": 1e20, "huge": 1e16, "tiny": 1e-7, "plain": 0.5}
+
+    assert json_codec.dumps_pretty(payload) == (
+        b'{\n  "big": 1e+20,\n  "huge": 1e+16,\n  "plain": 0.5,\n  "tiny": 1e-07\n}\n'
+    )
+
+
+def test_loads_accepts_bytes_and_str():
+    assert json_codec.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert json_codec.loads('{"a": "é"}') == {"a": "é"}
+
+
+def test_loads_raises_stdlib_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"not-json")
+
+
+def test_dumps_compact_matches_stdlib_layout():
+    payload = {"query": "query { ok }", "variables": {"name": "café", "first": 2}, "operationName": "Ok"}
+
+    expected = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    assert json_codec.dumps_compact(payload) == expected
@@ -1,38 +1,40 @@
-import json
+from datetime import datetime, timedelta, timezone
 
 import httpx
+import pytest
 
 from atlassian.graph.client import GraphQLClient
 from atlassian.oauth_3lo import OAuthRefreshTokenAuth
 
+from _httpx_utils import body_json
 
-def test_oauth_refresh_token_auth_applies_and_caches_token():
+
+def test_oauth_refresh_token_auth_applies_and_caches_token(routed_transport):
     calls = {"token": 0, "graphql": 0, "auth": []}
 
-    def handler(request: httpx.Request) -> httpx.Response:
-        if request.url.path == "/oauth/token":
-            calls["token"] += 1
-            payload = json.loads(request.content.decode("utf-8"))
-            assert payload["grant_type"] == "refresh_token"
-            assert payload["client_id"] == "client-id"
-            assert payload["client_secret"] == "client-secret"
-            assert payload["refresh_token"] == "refresh-token"
-            return httpx.Response(
-                200,
-                json={
-                    "access_token": "access-1",
-                    "token_type": "Bearer",
-                    "expires_in": 3600,
-                },
-                request=request,
-            )
-        if request.url.path == "/graphql":
-            calls["graphql"] += 1
-            calls["auth"].append(request.headers.get("Authorization"))
-            return httpx.Response(200, json={"data": {"ok": True}}, request=request)
-        return httpx.Response(404, json={"error": "not found"}, request=request)
+    def token(request: httpx.Request) -> httpx.Response:
+        calls["token"] += 1
+        payload = body_json(request)
+        assert payload["grant_type"] == "refresh_token"
+        assert payload["client_id"] == "client-id"
+        assert payload["client_secret"] == "client-secret"
+        assert payload["refresh_token"] == "refresh-token"
+        return httpx.Response(
+            200,
+            json={
+                "access_token": "access-1",
+                "token_type": "Bearer",
+                "expires_in": 3600,
+            },
+            request=request,
+        )
 
-    transport = httpx.MockTransport(handler)
+    def graphql(request: httpx.Request) -> httpx.Response:
+        calls["graphql"] += 1
+        calls["auth"].append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={"data": {"ok": True}}, request=request)
+
+    transport = routed_transport({"/oauth/token": [token], "/graphql": [graphql]})
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         auth = OAuthRefreshTokenAuth(
             client_id="client-id",
@@ -52,3 +54,75 @@ def test_oauth_refresh_token_auth_applies_and_caches_token():
     assert calls["token"] == 1
     assert calls["graphql"] == 2
     assert calls["auth"] == ["Bearer access-1", "Bearer access-1"]
+
+
+def test_oauth_refresh_token_auth_refreshes_before_expiry_on_monotonic_clock():
+    clock = {"now": 1000.0}
+    issued: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        issued.append(f"access-{len(issued) + 1}")
+        return httpx.Response(
+            200,
+            json={"access_token": issued[-1], "token_type": "Bearer", "expires_in": 3600},
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        auth = OAuthRefreshTokenAuth(
+            client_id="client-id",
+            client_secret="client-secret",
+            refresh_token="refresh-token",
+            token_url="https://example.com/oauth/token",
+            http_client=http_client,
+            refresh_margin_seconds=60,
+            clock=lambda: clock["now"],
+        )
+        headers: dict[str, str] = {}
+        auth.apply(headers)
+        assert headers["Authorization"] == "Bearer access-1"
+
+        clock["now"] += 3600 - 61
+        auth.apply(headers)
+        assert headers["Authorization"] == "Bearer access-1"
+
+        clock["now"] += 1
+        auth.apply(headers)
+        assert headers["Authorization"] == "Bearer access-2"
+
+    assert issued == ["access-1", "access-2"]
+
+
+def test_oauth_refresh_token_auth_accepts_deprecated_now():
+    current = {"now": datetime(2021, 5, 10, 11, 0, tzinfo=timezone.utc)}
+    issued: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        issued.append(f"access-{len(issued) + 1}")
+        return httpx.Response(
+            200,
+            json={"access_token": issued[-1], "token_type": "Bearer", "expires_in": 3600},
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        with pytest.warns(DeprecationWarning):
+            auth = OAuthRefreshTokenAuth(
+                client_id="client-id",
+                client_secret="client-secret",
+                refresh_token="refresh-token",
+                token_url="https://example.com/oauth/token",
+                http_client=http_client,
+                now=lambda: current["now"],
+            )
+        headers: dict[str, str] = {}
+        auth.apply(headers)
+        current["now"] += timedelta(seconds=3600 - 61)
+        auth.apply(headers)
+        assert headers["Authorization"] == "Bearer access-1"
+
+        current["now"] += timedelta(seconds=1)
+        auth.apply(headers)
+        assert headers["Authorization"] == "Bearer access-2"
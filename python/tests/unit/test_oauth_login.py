@@ -0,0 +1,46 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_TOOL_PATH = Path(__file__).resolve().parents[2] / "tools" / "oauth_login.py"
+
+
+@pytest.fixture
+def oauth_login(monkeypatch):
+    spec = importlib.util.spec_from_file_location("oauth_login", _TOOL_PATH)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    ("user_input", "expected"),
+    [
+        ("  raw-code  ", "raw-code"),
+        ("http://localhost:8080/callback?state=s&code=abc#code=ignored", "abc"),
+        ("http://localhost:8080/callback?code=a+b%20c", "a b c"),
+        ("http://localhost:8080/callback?code=&code=second", "second"),
+        ("http://localhost:8080/callback?cod%65=encoded-key", "encoded-key"),
+        ("http://localhost:8080/callback?code=a;b&state=s", "a;b"),
+        ("http://localhost:8080/callback?xcode=no&state=code%3Dno&code=yes", "yes"),
+    ],
+)
+def test_extract_code_matches_parse_qs(oauth_login, user_input, expected):
+    assert oauth_login._extract_code(user_input) == expected
+
+
+@pytest.mark.parametrize(
+    "user_input",
+    [
+        "",
+        "http://localhost:8080/callback?state=s",
+        "http://localhost:8080/callback#code=abc",
+        "http://localhost:8080/callback?code=",
+    ],
+)
+def test_extract_code_rejects_missing_code(oauth_login, user_input):
+    with pytest.raises(ValueError):
+        oauth_login._extract_code(user_input)
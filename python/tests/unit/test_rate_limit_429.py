@@ -1,5 +1,4 @@
 from datetime import datetime, timedelta, timezone
-import json
 
 import httpx
 import pytest
@@ -46,8 +45,7 @@ def test_jira_projects_retries_on_429_retry_after_timestamp():
     ]
 
     def handler(request: httpx.Request) -> httpx.Response:
-        payload = json.loads(request.content.decode("utf-8"))
-        assert payload.get("operationName") == "JiraProjectsPage"
+        assert b'"operationName":"JiraProjectsPage"' in request.content
         return responses.pop(0)(request)
 
     transport = httpx.MockTransport(handler)
@@ -0,0 +1,25 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from atlassian.retry import parse_retry_after
+
+
+@pytest.mark.parametrize(
+    "header, expected, parser",
+    [
+        ("Mon, 10 May 2021 11:00:00 GMT", datetime(2021, 5, 10, 11, 0, 0, tzinfo=timezone.utc), "http-date"),
+        ("2021-05-10T11:00Z", datetime(2021, 5, 10, 11, 0, 0, tzinfo=timezone.utc), "rfc3339"),
+        ("2021-05-10T13:00:00+02:00", datetime(2021, 5, 10, 11, 0, 0, tzinfo=timezone.utc), "rfc3339"),
+        # obsolete RFC 850 form still goes through the generic HTTP-date parser
+        ("Monday, 10-May-21 11:00:00 GMT", datetime(2021, 5, 10, 11, 0, 0, tzinfo=timezone.utc), "http-date"),
+    ],
+)
+def test_parse_retry_after_formats(header, expected, parser):
+    assert parse_retry_after(header) == (expected, parser)
+
+
+@pytest.mark.parametrize("header", ["invalid", "Mon, 32 May 2021 11:00:00 GMT", ""])
+def test_parse_retry_after_rejects_garbage(header):
+    with pytest.raises(ValueError):
+        parse_retry_after(header)
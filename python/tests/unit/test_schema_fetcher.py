@@ -5,13 +5,15 @@ import httpx
 from atlassian.auth import OAuthBearerAuth
 from atlassian.graph.schema_fetcher import fetch_schema_introspection
 
+from _httpx_utils import body_json
 
-def test_schema_fetcher_writes_introspection_json(tmp_path):
+
+def test_schema_fetcher_writes_introspection_json(tmp_path, routed_transport):
     captured: dict[str, object] = {}
 
-    def handler(request: httpx.Request):
+    def introspection(request: httpx.Request):
         captured["beta"] = request.headers.get_list("X-ExperimentalApi")
-        payload = json.loads(request.content.decode("utf-8")) if request.content else {}
+        payload = body_json(request)
         captured["query"] = payload.get("query")
         return httpx.Response(
             200,
@@ -26,7 +28,8 @@ def test_schema_fetcher_writes_introspection_json(tmp_path):
             },
             request=request,
         )
-    transport = httpx.MockTransport(handler)
+
+    transport = routed_transport({"/graphql": [introspection]})
     with httpx.Client(transport=transport, timeout=5.0) as http_client:
         result = fetch_schema_introspection(
             "https://api.atlassian.com",
@@ -40,3 +43,26 @@ def test_schema_fetcher_writes_introspection_json(tmp_path):
     assert "__schema" in json.loads(result.introspection_json_path.read_text("utf-8"))["data"]
     assert captured["beta"] == ["featureA", "featureB"]
     assert isinstance(captured["query"], str) and "__schema" in captured["query"]
+
+
+def test_schema_fetcher_skips_rewrite_when_unchanged(tmp_path, routed_transport):
+    def introspection(request: httpx.Request):
+        return httpx.Response(200, json={"data": {"__schema": {"types": []}}}, request=request)
+
+    transport = routed_transport({"/graphql": [introspection]})
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        first = fetch_schema_introspection(
+            "https://api.atlassian.com",
+            OAuthBearerAuth(lambda: "token"),
+            output_dir=tmp_path,
+            http_client=http_client,
+        )
+        inode = first.introspection_json_path.stat().st_ino
+        second = fetch_schema_introspection(
+            "https://api.atlassian.com",
+            OAuthBearerAuth(lambda: "token"),
+            output_dir=tmp_path,
+            http_client=http_client,
+        )
+
+    assert second.introspection_json_path.stat().st_ino == inode
@@ -0,0 +1,26 @@
+import httpx
+
+from atlassian.auth import OAuthBearerAuth
+from atlassian.graph.client import GraphQLClient
+from atlassian.rest.client import JiraRestClient
+
+
+def test_graphql_and_rest_clients_share_one_http_client():
+    seen_paths: list = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_paths.append(request.url.path)
+        if request.url.path == "/graphql":
+            return httpx.Response(200, json={"data": {"ok": True}}, request=request)
+        return httpx.Response(200, json={"values": []}, request=request)
+
+    transport = httpx.MockTransport(handler)
+    with httpx.Client(transport=transport, timeout=5.0) as http_client:
+        auth = OAuthBearerAuth(lambda: "token")
+        with GraphQLClient("https://api.atlassian.com", auth=auth, http_client=http_client) as gql:
+            assert gql.execute("query { ok }").data == {"ok": True}
+        with JiraRestClient("https://api.atlassian.com", auth=auth, http_client=http_client) as rest:
+            assert rest.get_json("/rest/api/3/project/search") == {"values": []}
+
+        assert not http_client.is_closed
+        assert seen_paths == ["/graphql", "/rest/api/3/project/search"]
@@ -4,6 +4,9 @@ import json
 import os
 import sys
 from pathlib import Path
+from typing import Mapping
+
+import httpx
 
 
 def _add_project_to_syspath() -> None:
@@ -18,43 +21,71 @@ from atlassian.auth import (  # noqa: E402
     CookieAuth,
     OAuthBearerAuth,
 )
+from atlassian.http2 import http2_available  # noqa: E402
 from atlassian.oauth_3lo import OAuthRefreshTokenAuth  # noqa: E402
 from atlassian.graph.schema_fetcher import fetch_schema_introspection  # noqa: E402
 
 
-def _auth_from_env():
-    token = os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN")
-    refresh_token = os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
-    client_id = os.getenv("ATLASSIAN_CLIENT_ID")
-    client_secret = os.getenv("ATLASSIAN_CLIENT_SECRET")
-    email = os.getenv("ATLASSIAN_EMAIL")
-    api_token = os.getenv("ATLASSIAN_API_TOKEN")
-    cookies_json = os.getenv("ATLASSIAN_COOKIES_JSON")
-
-    if refresh_token and client_id and client_secret:
-        return OAuthRefreshTokenAuth(
-            client_id=client_id,
-            client_secret=client_secret,
-            refresh_token=refresh_token,
+def _refresh_token_auth(env: Mapping[str, str], http_client: httpx.Client | None):
+    refresh_token = env.get("ATLASSIAN_OAUTH_REFRESH_TOKEN")
+    client_id = env.get("ATLASSIAN_CLIENT_ID")
+    client_secret = env.get("ATLASSIAN_CLIENT_SECRET")
+    if not (refresh_token and client_id and client_secret):
+        return None
+    return OAuthRefreshTokenAuth(
+        client_id=client_id,
+        client_secret=client_secret,
+        refresh_token=refresh_token,
+        http_client=http_client,
+    )
+
+
+def _bearer_auth(env: Mapping[str, str], http_client: httpx.Client | None):
+    token = env.get("ATLASSIAN_OAUTH_ACCESS_TOKEN")
+    if not token:
+        return None
+    client_secret = env.get("ATLASSIAN_CLIENT_SECRET")
+    if client_secret and token.strip() == client_secret.strip():
+        raise ValueError(
+            "ATLASSIAN_OAUTH_ACCESS_TOKEN appears to be set to ATLASSIAN_CLIENT_SECRET; "
+            "set an OAuth access token (not the client secret)."
         )
-    if token:
-        if client_secret and token.strip() == client_secret.strip():
-            raise ValueError(
-                "ATLASSIAN_OAUTH_ACCESS_TOKEN appears to be set to ATLASSIAN_CLIENT_SECRET; "
-                "set an OAuth access token (not the client secret)."
-            )
-        return OAuthBearerAuth(lambda: token)
-    if email and api_token:
-        return BasicApiTokenAuth(email, api_token)
-    if cookies_json:
-        try:
-            cookies = json.loads(cookies_json)
-        except json.JSONDecodeError:
-            return None
-        if isinstance(cookies, dict) and all(
-            isinstance(k, str) and isinstance(v, str) for k, v in cookies.items()
-        ):
-            return CookieAuth(cookies)
+    return OAuthBearerAuth(lambda: token)
+
+
+def _basic_auth(env: Mapping[str, str], http_client: httpx.Client | None):
+    email = env.get("ATLASSIAN_EMAIL")
+    api_token = env.get("ATLASSIAN_API_TOKEN")
+    if not (email and api_token):
+        return None
+    return BasicApiTokenAuth(email, api_token)
+
+
+def _cookie_auth(env: Mapping[str, str], http_client: httpx.Client | None):
+    cookies_json = env.get("ATLASSIAN_COOKIES_JSON")
+    if not cookies_json:
+        return None
+    try:
+        cookies = json.loads(cookies_json)
+    except json.JSONDecodeError:
+        return None
+    if isinstance(cookies, dict) and all(
+        isinstance(k, str) and isinstance(v, str) for k, v in cookies.items()
+    ):
+        return CookieAuth(cookies)
+    return None
+
+
+# Checked in order; the first factory that returns an auth provider wins.
+_AUTH_FACTORIES = (_refresh_token_auth, _bearer_auth, _basic_auth, _cookie_auth)
+
+
+def _auth_from_env(http_client: httpx.Client | None = None, env: Mapping[str, str] | None = None):
+    snapshot = dict(os.environ if env is None else env)
+    for factory in _AUTH_FACTORIES:
+        auth = factory(snapshot, http_client)
+        if auth is not None:
+            return auth
     return None
 
 
@@ -73,27 +104,30 @@ def main() -> int:
         or os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
     ):
         base_url = "https://api.atlassian.com"
-    try:
-        auth = _auth_from_env()
-    except ValueError as exc:
-        print(str(exc), file=sys.stderr)
-        return 2
-    if not base_url or auth is None:
-        print(
-            "Missing credentials. Set ATLASSIAN_GQL_BASE_URL and one of: "
-            "ATLASSIAN_OAUTH_ACCESS_TOKEN, or ATLASSIAN_OAUTH_REFRESH_TOKEN + (ATLASSIAN_CLIENT_ID + ATLASSIAN_CLIENT_SECRET), "
-            "or (ATLASSIAN_EMAIL + ATLASSIAN_API_TOKEN), or ATLASSIAN_COOKIES_JSON.",
-            file=sys.stderr,
+    # One connection pool for both the OAuth token refresh and the introspection POST.
+    with httpx.Client(timeout=30.0, http2=http2_available()) as http_client:
+        try:
+            auth = _auth_from_env(http_client)
+        except ValueError as exc:
+            print(str(exc), file=sys.stderr)
+            return 2
+        if not base_url or auth is None:
+            print(
+                "Missing credentials. Set ATLASSIAN_GQL_BASE_URL and one of: "
+                "ATLASSIAN_OAUTH_ACCESS_TOKEN, or ATLASSIAN_OAUTH_REFRESH_TOKEN + (ATLASSIAN_CLIENT_ID + ATLASSIAN_CLIENT_SECRET), "
+                "or (ATLASSIAN_EMAIL + ATLASSIAN_API_TOKEN), or ATLASSIAN_COOKIES_JSON.",
+                file=sys.stderr,
+            )
+            return 2
+
+        result = fetch_schema_introspection(
+            base_url,
+            auth,
+            output_dir=out_dir,
+            experimental_apis=_experimental_apis() or None,
+            timeout_seconds=30.0,
+            http_client=http_client,
         )
-        return 2
-
-    result = fetch_schema_introspection(
-        base_url,
-        auth,
-        output_dir=out_dir,
-        experimental_apis=_experimental_apis() or None,
-        timeout_seconds=30.0,
-    )
     print(f"Wrote {result.introspection_json_path}")
     if result.sdl_path:
         print(f"Wrote {result.sdl_path}")
@@ -4,6 +4,8 @@ import argparse
 import sys
 from pathlib import Path
 
+import httpx
+
 
 def _add_project_to_syspath() -> None:
     project_root = Path(__file__).resolve().parents[1]
@@ -12,6 +14,7 @@ def _add_project_to_syspath() -> None:
 
 _add_project_to_syspath()
 
+from atlassian.http2 import http2_available
 from atlassian.rest.openapi_fetcher import (
     DEFAULT_JIRA_REST_OPENAPI_URL,
     fetch_jira_rest_openapi,
@@ -32,7 +35,8 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    out = fetch_jira_rest_openapi(url=args.url, output_path=args.out)
+    with httpx.Client(timeout=30.0, http2=http2_available()) as http_client:
+        out = fetch_jira_rest_openapi(url=args.url, output_path=args.out, http_client=http_client)
     print(str(out))
     return 0
 
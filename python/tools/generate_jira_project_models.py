@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import argparse
+import functools
 import json
 import os
+import py_compile
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 
 def _add_project_to_syspath() -> None:
@@ -15,6 +19,7 @@ def _add_project_to_syspath() -> None:
 
 _add_project_to_syspath()
 
+from atlassian import json_codec  # noqa: E402
 from atlassian.auth import (  # noqa: E402
     BasicApiTokenAuth,
     CookieAuth,
@@ -48,6 +53,39 @@ def _env_experimental_apis() -> List[str]:
     return [part.strip() for part in raw.split(",") if part.strip()]
 
 
+def _env_schema_ttl_seconds() -> Optional[float]:
+    raw = os.getenv("ATLASSIAN_GQL_SCHEMA_TTL_SECONDS", "").strip()
+    if not raw:
+        return None
+    try:
+        ttl = float(raw)
+    except ValueError:
+        raise ValueError("ATLASSIAN_GQL_SCHEMA_TTL_SECONDS must be a number of seconds") from None
+    if not ttl >= 0:  # also rejects NaN
+        raise ValueError("ATLASSIAN_GQL_SCHEMA_TTL_SECONDS must be >= 0")
+    return ttl
+
+
+def _schema_needs_fetch(schema_path: Path, ttl_seconds: Optional[float]) -> bool:
+    try:
+        mtime = schema_path.stat().st_mtime
+    except FileNotFoundError:
+        return True
+    return ttl_seconds is not None and time.time() - mtime > ttl_seconds
+
+
+def _fetch_schema(schema_path: Path, base_url: str, auth) -> None:
+    fetch_schema_introspection(
+        base_url,
+        auth,
+        output_dir=schema_path.parent,
+        experimental_apis=_env_experimental_apis(),
+    )
+    # The fetcher leaves an unchanged file untouched, but the TTL is measured from the
+    # mtime, so mark the schema as freshly fetched or it would be refetched on every run.
+    os.utime(schema_path)
+
+
 def _build_auth_from_env():
     token = os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN")
     refresh_token = os.getenv("ATLASSIAN_OAUTH_REFRESH_TOKEN")
@@ -85,7 +123,7 @@ def _build_auth_from_env():
 
 
 def _load_introspection(path: Path) -> Dict[str, Any]:
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = json_codec.loads(path.read_bytes())
     if isinstance(raw, dict) and "data" in raw and isinstance(raw["data"], dict):
         data = raw["data"]
     else:
@@ -98,34 +136,15 @@ def _load_introspection(path: Path) -> Dict[str, Any]:
     return schema
 
 
-def _types_map(schema: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-    types = schema.get("types")
-    if not isinstance(types, list):
-        raise RuntimeError("Introspection JSON missing __schema.types[]")
-    out: Dict[str, Dict[str, Any]] = {}
-    for t in types:
-        if not isinstance(t, dict):
-            continue
-        name = t.get("name")
-        if isinstance(name, str) and name:
-            out[name] = t
-    return out
-
-
-def _unwrap_named_type(type_ref: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Dict[str, Any]]:
+def _unwrap_name(type_ref: Any) -> Optional[str]:
+    """Return the named type under any NON_NULL/LIST wrappers, or None."""
     cur = type_ref
-    for _ in range(16):
-        if not isinstance(cur, dict):
-            break
-        kind = cur.get("kind")
+    while isinstance(cur, dict):
         name = cur.get("name")
         if isinstance(name, str) and name:
-            return name, kind if isinstance(kind, str) else None, cur
-        nxt = cur.get("ofType")
-        if nxt is None:
-            break
-        cur = nxt
-    return None, None, {}
+            return name
+        cur = cur.get("ofType")
+    return None
 
 
 def _type_ref_to_gql(type_ref: Dict[str, Any]) -> str:
@@ -146,38 +165,74 @@ def _type_ref_to_gql(type_ref: Dict[str, Any]) -> str:
     return name
 
 
-def _field(type_def: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
-    fields = type_def.get("fields")
-    if not isinstance(fields, list):
-        return None
-    for f in fields:
-        if isinstance(f, dict) and f.get("name") == name:
-            return f
-    return None
+def _by_name(entries: Any) -> Dict[str, Dict[str, Any]]:
+    index: Dict[str, Dict[str, Any]] = {}
+    if isinstance(entries, list):
+        for entry in entries:
+            if isinstance(entry, dict):
+                name = entry.get("name")
+                if isinstance(name, str):
+                    index.setdefault(name, entry)
+    return index
 
 
-def _input_field(type_def: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
-    fields = type_def.get("inputFields")
-    if not isinstance(fields, list):
-        return None
-    for f in fields:
-        if isinstance(f, dict) and f.get("name") == name:
-            return f
-    return None
+class _SchemaIndex(NamedTuple):
+    types: Dict[str, Dict[str, Any]]
+    fields: Dict[str, Dict[str, Dict[str, Any]]]
+    input_fields: Dict[str, Dict[str, Dict[str, Any]]]
+    args: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]]
 
+    def field(self, type_name: str, name: str) -> Optional[Dict[str, Any]]:
+        return self.fields.get(type_name, {}).get(name)
 
-def _arg(field_def: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
-    args = field_def.get("args")
-    if not isinstance(args, list):
-        return None
-    for a in args:
-        if isinstance(a, dict) and a.get("name") == name:
-            return a
-    return None
+    def input_field(self, type_name: str, name: str) -> Optional[Dict[str, Any]]:
+        return self.input_fields.get(type_name, {}).get(name)
+
+    def arg(self, type_name: str, field_name: str, name: str) -> Optional[Dict[str, Any]]:
+        return self.args.get((type_name, field_name), {}).get(name)
+
+
+def _index_schema(schema: Dict[str, Any]) -> _SchemaIndex:
+    """Index types, fields, input fields and args by name in one pass over __schema.types."""
+    types = schema.get("types")
+    if not isinstance(types, list):
+        raise RuntimeError("Introspection JSON missing __schema.types[]")
+    index = _SchemaIndex({}, {}, {}, {})
+    for type_def in types:
+        if not isinstance(type_def, dict):
+            continue
+        type_name = type_def.get("name")
+        if not isinstance(type_name, str) or not type_name:
+            continue
+        index.types[type_name] = type_def
+        fields = index.fields[type_name] = _by_name(type_def.get("fields"))
+        index.input_fields[type_name] = _by_name(type_def.get("inputFields"))
+        for field_name, field_def in fields.items():
+            index.args[(type_name, field_name)] = _by_name(field_def.get("args"))
+    return index
+
+
+def _project_lookup_candidates(
+    index: _SchemaIndex, jira_type_name: str, project_type_name: str
+) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """Yield (field, key arg, key arg type) for jira fields that look up one project by cloudId + key."""
+    for field_name, f in index.fields.get(jira_type_name, {}).items():
+        args = index.args[(jira_type_name, field_name)]
+        if not field_name or not args.get("cloudId"):
+            continue
+        f_type_name = _unwrap_name(f.get("type") or {})
+        if f_type_name != project_type_name:
+            continue
+        for key_arg_name in ("key", "projectKey"):
+            key_arg = args.get(key_arg_name)
+            if key_arg and isinstance(key_arg.get("type"), dict):
+                yield field_name, key_arg_name, key_arg["type"]
+                break
 
 
 def _discover_config(schema: Dict[str, Any]) -> _Config:
-    types = _types_map(schema)
+    index = _index_schema(schema)
+    types = index.types
     missing: List[str] = []
 
     query_type = schema.get("queryType")
@@ -188,48 +243,47 @@ def _discover_config(schema: Dict[str, Any]) -> _Config:
     if not query_def:
         raise RuntimeError(f"Missing query type definition: {query_name}")
 
-    jira_field = _field(query_def, "jira")
+    jira_field = index.field(query_name, "jira")
     if not jira_field:
         missing.append(f"type {query_name}.fields.jira")
         raise RuntimeError("Missing required fields:\n- " + "\n- ".join(missing))
-    jira_type_name, _, _ = _unwrap_named_type(jira_field.get("type") or {})
+    jira_type_name = _unwrap_name(jira_field.get("type") or {})
     if not jira_type_name or jira_type_name not in types:
         raise RuntimeError("Failed to resolve type for field Query.jira")
-    jira_def = types[jira_type_name]
 
-    all_projects_field = _field(jira_def, "allJiraProjects")
+    all_projects_field = index.field(jira_type_name, "allJiraProjects")
     if not all_projects_field:
         missing.append(f"type {jira_type_name}.fields.allJiraProjects")
         raise RuntimeError("Missing required fields:\n- " + "\n- ".join(missing))
 
     for arg_name in ("cloudId", "filter", "first", "after"):
-        if not _arg(all_projects_field, arg_name):
+        if not index.arg(jira_type_name, "allJiraProjects", arg_name):
             missing.append(f"field jira.allJiraProjects.args.{arg_name}")
 
     cloud_id_type = ""
     projects_first_type = ""
     projects_after_type = ""
 
-    cloud_arg = _arg(all_projects_field, "cloudId")
+    cloud_arg = index.arg(jira_type_name, "allJiraProjects", "cloudId")
     if cloud_arg and isinstance(cloud_arg.get("type"), dict):
         cloud_id_type = _type_ref_to_gql(cloud_arg["type"])
 
-    first_arg = _arg(all_projects_field, "first")
+    first_arg = index.arg(jira_type_name, "allJiraProjects", "first")
     if first_arg and isinstance(first_arg.get("type"), dict):
         projects_first_type = _type_ref_to_gql(first_arg["type"])
 
-    after_arg = _arg(all_projects_field, "after")
+    after_arg = index.arg(jira_type_name, "allJiraProjects", "after")
     if after_arg and isinstance(after_arg.get("type"), dict):
         projects_after_type = _type_ref_to_gql(after_arg["type"])
 
-    filter_arg = _arg(all_projects_field, "filter")
+    filter_arg = index.arg(jira_type_name, "allJiraProjects", "filter")
     if filter_arg and isinstance(filter_arg.get("type"), dict):
-        filter_type_name, _, _ = _unwrap_named_type(filter_arg["type"])
+        filter_type_name = _unwrap_name(filter_arg["type"])
         filter_def = types.get(filter_type_name or "")
         if not filter_def:
             missing.append("field jira.allJiraProjects.args.filter.type")
         else:
-            types_field = _input_field(filter_def, "types")
+            types_field = index.input_field(filter_type_name, "types")
             if not types_field:
                 missing.append(f"type {filter_type_name}.inputFields.types")
             else:
@@ -237,14 +291,14 @@ def _discover_config(schema: Dict[str, Any]) -> _Config:
                 if not isinstance(tref, dict):
                     missing.append(f"type {filter_type_name}.inputFields.types.type")
 
-    conn_type_name, _, _ = _unwrap_named_type(all_projects_field.get("type") or {})
+    conn_type_name = _unwrap_name(all_projects_field.get("type") or {})
     conn_def = types.get(conn_type_name or "")
     if not conn_def:
         missing.append("field jira.allJiraProjects.type")
         raise RuntimeError("Missing required fields:\n- " + "\n- ".join(missing))
 
-    page_info_field = _field(conn_def, "pageInfo")
-    edges_field = _field(conn_def, "edges")
+    page_info_field = index.field(conn_type_name, "pageInfo")
+    edges_field = index.field(conn_type_name, "edges")
     if not page_info_field:
         missing.append(f"type {conn_type_name}.fields.pageInfo")
     if not edges_field:
@@ -252,41 +306,41 @@ def _discover_config(schema: Dict[str, Any]) -> _Config:
     if missing:
         raise RuntimeError("Missing required fields:\n- " + "\n- ".join(missing))
 
-    pageinfo_type_name, _, _ = _unwrap_named_type(page_info_field.get("type") or {})
+    pageinfo_type_name = _unwrap_name(page_info_field.get("type") or {})
     pageinfo_def = types.get(pageinfo_type_name or "")
     if not pageinfo_def:
         raise RuntimeError(f"Missing PageInfo type definition: {pageinfo_type_name}")
 
-    has_next = _field(pageinfo_def, "hasNextPage")
+    has_next = index.field(pageinfo_type_name, "hasNextPage")
     if not has_next:
         raise RuntimeError(f"Missing PageInfo.hasNextPage on {pageinfo_type_name}")
-    pageinfo_has_end_cursor = _field(pageinfo_def, "endCursor") is not None
+    pageinfo_has_end_cursor = index.field(pageinfo_type_name, "endCursor") is not None
 
-    edges_type_name, _, _ = _unwrap_named_type(edges_field.get("type") or {})
+    edges_type_name = _unwrap_name(edges_field.get("type") or {})
     edges_def = types.get(edges_type_name or "")
     if not edges_def:
         raise RuntimeError(f"Missing edge type definition: {edges_type_name}")
-    projects_edge_has_cursor = _field(edges_def, "cursor") is not None
+    projects_edge_has_cursor = index.field(edges_type_name, "cursor") is not None
 
-    node_field = _field(edges_def, "node")
+    node_field = index.field(edges_type_name, "node")
     if not node_field:
         raise RuntimeError(f"Missing edge.node on {edges_type_name}")
-    project_type_name, _, _ = _unwrap_named_type(node_field.get("type") or {})
+    project_type_name = _unwrap_name(node_field.get("type") or {})
     project_def = types.get(project_type_name or "")
     if not project_def:
         raise RuntimeError(f"Missing project type definition: {project_type_name}")
 
-    project_has_id = _field(project_def, "id") is not None
-    if not _field(project_def, "key"):
+    project_has_id = index.field(project_type_name, "id") is not None
+    if not index.field(project_type_name, "key"):
         missing.append(f"type {project_type_name}.fields.key")
-    if not _field(project_def, "name"):
+    if not index.field(project_type_name, "name"):
         missing.append(f"type {project_type_name}.fields.name")
-    ops_field = _field(project_def, "opsgenieTeamsAvailableToLinkWith")
+    ops_field = index.field(project_type_name, "opsgenieTeamsAvailableToLinkWith")
     if not ops_field:
         missing.append(f"type {project_type_name}.fields.opsgenieTeamsAvailableToLinkWith")
     else:
         for arg_name in ("first", "after"):
-            if not _arg(ops_field, arg_name):
+            if not index.arg(project_type_name, "opsgenieTeamsAvailableToLinkWith", arg_name):
                 missing.append(f"field {project_type_name}.opsgenieTeamsAvailableToLinkWith.args.{arg_name}")
 
     if missing:
@@ -294,20 +348,20 @@ def _discover_config(schema: Dict[str, Any]) -> _Config:
 
     ops_first_type = ""
     ops_after_type = ""
-    ops_first_arg = _arg(ops_field, "first")
+    ops_first_arg = index.arg(project_type_name, "opsgenieTeamsAvailableToLinkWith", "first")
     if ops_first_arg and isinstance(ops_first_arg.get("type"), dict):
         ops_first_type = _type_ref_to_gql(ops_first_arg["type"])
-    ops_after_arg = _arg(ops_field, "after")
+    ops_after_arg = index.arg(project_type_name, "opsgenieTeamsAvailableToLinkWith", "after")
     if ops_after_arg and isinstance(ops_after_arg.get("type"), dict):
         ops_after_type = _type_ref_to_gql(ops_after_arg["type"])
 
-    ops_conn_type_name, _, _ = _unwrap_named_type(ops_field.get("type") or {})
+    ops_conn_type_name = _unwrap_name(ops_field.get("type") or {})
     ops_conn_def = types.get(ops_conn_type_name or "")
     if not ops_conn_def:
         raise RuntimeError(f"Missing opsgenie connection type: {ops_conn_type_name}")
 
-    ops_page_info_field = _field(ops_conn_def, "pageInfo")
-    ops_edges_field = _field(ops_conn_def, "edges")
+    ops_page_info_field = index.field(ops_conn_type_name, "pageInfo")
+    ops_edges_field = index.field(ops_conn_type_name, "edges")
     if not ops_page_info_field:
         missing.append(f"type {ops_conn_type_name}.fields.pageInfo")
     if not ops_edges_field:
@@ -315,22 +369,22 @@ def _discover_config(schema: Dict[str, Any]) -> _Config:
     if missing:
         raise RuntimeError("Missing required fields:\n- " + "\n- ".join(missing))
 
-    ops_edges_type_name, _, _ = _unwrap_named_type(ops_edges_field.get("type") or {})
+    ops_edges_type_name = _unwrap_name(ops_edges_field.get("type") or {})
     ops_edges_def = types.get(ops_edges_type_name or "")
     if not ops_edges_def:
         raise RuntimeError(f"Missing opsgenie edge type: {ops_edges_type_name}")
-    ops_edge_has_cursor = _field(ops_edges_def, "cursor") is not None
+    ops_edge_has_cursor = index.field(ops_edges_type_name, "cursor") is not None
 
-    ops_node_field = _field(ops_edges_def, "node")
+    ops_node_field = index.field(ops_edges_type_name, "node")
     if not ops_node_field:
         raise RuntimeError(f"Missing opsgenie edge.node on {ops_edges_type_name}")
-    ops_team_type_name, _, _ = _unwrap_named_type(ops_node_field.get("type") or {})
+    ops_team_type_name = _unwrap_name(ops_node_field.get("type") or {})
     ops_team_def = types.get(ops_team_type_name or "")
     if not ops_team_def:
         raise RuntimeError(f"Missing opsgenie team type: {ops_team_type_name}")
-    if not _field(ops_team_def, "id"):
+    if not index.field(ops_team_type_name, "id"):
         missing.append(f"type {ops_team_type_name}.fields.id")
-    if not _field(ops_team_def, "name"):
+    if not index.field(ops_team_type_name, "name"):
         missing.append(f"type {ops_team_type_name}.fields.name")
     if missing:
         raise RuntimeError("Missing required fields:\n- " + "\n- ".join(missing))
@@ -341,37 +395,18 @@ def _discover_config(schema: Dict[str, Any]) -> _Config:
     jira_project_key_arg_name: Optional[str] = None
     jira_project_key_arg_type: Optional[str] = None
 
-    node_field_def = _field(query_def, "node")
+    node_field_def = index.field(query_name, "node")
     if node_field_def:
-        id_arg = _arg(node_field_def, "id")
+        id_arg = index.arg(query_name, "node", "id")
         if id_arg and isinstance(id_arg.get("type"), dict) and project_has_id:
             node_id_arg_type = _type_ref_to_gql(id_arg["type"])
             refetch_strategy = "node"
 
     if refetch_strategy != "node":
-        candidates: List[Tuple[str, Dict[str, Any]]] = []
-        for f in jira_def.get("fields", []):
-            if not isinstance(f, dict):
-                continue
-            f_type_name, _, _ = _unwrap_named_type(f.get("type") or {})
-            if f_type_name == project_type_name:
-                candidates.append((f.get("name") or "", f))
-
-        candidates = sorted(candidates, key=lambda item: item[0])
-        for field_name, f in candidates:
-            if not field_name:
-                continue
-            if not _arg(f, "cloudId"):
-                continue
-            for key_arg_name in ("key", "projectKey"):
-                key_arg = _arg(f, key_arg_name)
-                if key_arg and isinstance(key_arg.get("type"), dict):
-                    jira_project_field_name = field_name
-                    jira_project_key_arg_name = key_arg_name
-                    jira_project_key_arg_type = _type_ref_to_gql(key_arg["type"])
-                    break
-            if jira_project_field_name:
-                break
+        lookup = min(_project_lookup_candidates(index, jira_type_name, project_type_name), key=lambda c: c[0], default=None)
+        if lookup is not None:
+            jira_project_field_name, jira_project_key_arg_name, key_arg_type = lookup
+            jira_project_key_arg_type = _type_ref_to_gql(key_arg_type)
 
         if not jira_project_field_name:
             raise RuntimeError(
@@ -398,22 +433,46 @@ def _discover_config(schema: Dict[str, Any]) -> _Config:
     )
 
 
-def _render_python(cfg: _Config) -> str:
-    pageinfo_select = "hasNextPage"
-    if cfg.pageinfo_has_end_cursor:
-        pageinfo_select += " endCursor"
+def _triple_quoted(text: str) -> str:
+    if '"""' in text or "\\" in text or text.endswith('"'):
+        raise RuntimeError("generated query cannot be embedded in a triple-quoted string")
+    return '"""' + text + '"""'
 
-    project_edge_select = "node {"
-    if cfg.projects_edge_has_cursor:
-        project_edge_select = "cursor\n      node {"
 
-    ops_edge_select = "node {"
-    if cfg.ops_edge_has_cursor:
-        ops_edge_select = "cursor\n            node {"
+def _optional_str_check(enabled: bool, var: str, key: str, path_expr: str = "path") -> str:
+    if not enabled:
+        return ""
+    return (
+        f'        {var} = raw.get("{key}")\n'
+        f"        if {var} is not None and not isinstance({var}, str):\n"
+        f'            raise SerializationError(f"Expected string at {{{path_expr}}}.{key}")\n'
+    )
+
+
+def _fast_optional_str(enabled: bool, var: str, getter: str, key: str, indent: int) -> str:
+    if not enabled:
+        return ""
+    pad = " " * indent
+    return (
+        f'{pad}{var} = {getter}("{key}")\n'
+        f"{pad}if {var} is not None and not isinstance({var}, str):\n"
+        f"{pad}    raise _FastPathMiss\n"
+    )
 
-    project_id_select = "id\n          " if cfg.project_has_id else ""
 
-    projects_page_query_template = f"""\
+def _pageinfo_select(cfg: _Config) -> str:
+    return "hasNextPage endCursor" if cfg.pageinfo_has_end_cursor else "hasNextPage"
+
+
+def _edge_select(has_cursor: bool, indent: int) -> str:
+    return "cursor\n" + " " * indent + "node {" if has_cursor else "node {"
+
+
+def _render_projects_page_query(cfg: _Config) -> str:
+    pageinfo_select = _pageinfo_select(cfg)
+    project_edge_select = _edge_select(cfg.projects_edge_has_cursor, 8)
+    project_id_select = "id\n          " if cfg.project_has_id else ""
+    return f"""\
 query JiraProjectsPage(
   $cloudId: {cfg.cloud_id_type},
   $first: {cfg.projects_first_type},
@@ -435,7 +494,7 @@ query JiraProjectsPage(
           opsgenieTeams: opsgenieTeamsAvailableToLinkWith(first: $opsFirst) {{
             pageInfo {{ {pageinfo_select} }}
             edges {{
-              {ops_edge_select}
+              {_edge_select(cfg.ops_edge_has_cursor, 14)}
                 id
                 name
               }}
@@ -448,10 +507,13 @@ query JiraProjectsPage(
 }}
 """
 
+
+def _render_ops_query(cfg: _Config) -> str:
+    pageinfo_select = _pageinfo_select(cfg)
     if cfg.refetch_strategy == "node":
         if not cfg.node_id_arg_type:
             raise RuntimeError("invalid config: node strategy missing node_id_arg_type")
-        ops_query = f"""\
+        return f"""\
 query JiraProjectOpsgenieTeamsPage(
   $projectId: {cfg.node_id_arg_type},
   $first: {cfg.ops_first_type},
@@ -462,7 +524,7 @@ query JiraProjectOpsgenieTeamsPage(
       opsgenieTeams: opsgenieTeamsAvailableToLinkWith(first: $first, after: $after) {{
         pageInfo {{ {pageinfo_select} }}
         edges {{
-          {ops_edge_select}
+          {_edge_select(cfg.ops_edge_has_cursor, 10)}
             id
             name
           }}
@@ -472,10 +534,10 @@ query JiraProjectOpsgenieTeamsPage(
   }}
 }}
 """
-    else:
-        if not cfg.jira_project_field_name or not cfg.jira_project_key_arg_name or not cfg.jira_project_key_arg_type:
-            raise RuntimeError("invalid config: jira strategy missing project lookup details")
-        ops_query = f"""\
+
+    if not cfg.jira_project_field_name or not cfg.jira_project_key_arg_name or not cfg.jira_project_key_arg_type:
+        raise RuntimeError("invalid config: jira strategy missing project lookup details")
+    return f"""\
 query JiraProjectOpsgenieTeamsPage(
   $cloudId: {cfg.cloud_id_type},
   $projectKey: {cfg.jira_project_key_arg_type},
@@ -487,7 +549,7 @@ query JiraProjectOpsgenieTeamsPage(
       opsgenieTeams: opsgenieTeamsAvailableToLinkWith(first: $first, after: $after) {{
         pageInfo {{ {pageinfo_select} }}
         edges {{
-          {ops_edge_select}
+          {_edge_select(cfg.ops_edge_has_cursor, 10)}
             id
             name
           }}
@@ -498,130 +560,196 @@ query JiraProjectOpsgenieTeamsPage(
 }}
 """
 
+
+def _render_opsgenie_teams_parser(cfg: _Config) -> str:
+    if cfg.refetch_strategy == "node":
+        keys = ["project", "opsgenieTeams"]
+    else:
+        keys = ["jira", "project", "opsgenieTeams"]
+    lookup = "data" + "".join(f'["{key}"]' for key in keys)
+    parent_path = ".".join(["data"] + keys[:-1])
+
+    checks: List[str] = []
+    var = "data"
+    path = "data"
+    for key in keys[:-1]:
+        child_path = f"{path}.{key}"
+        checks.append(
+            f'    {key} = _expect_dict({var}, "{path}").get("{key}")\n'
+            f"    if {key} is None:\n"
+            f'        raise SerializationError("Missing {child_path}")\n'
+        )
+        var, path = key, child_path
+    checks.append(
+        f'    inner = _expect_dict({var}, "{path}").get("{keys[-1]}")\n'
+        "    if inner is None:\n"
+        f'        raise SerializationError("Missing {path}.{keys[-1]}")\n'
+    )
+
     return f"""\
+def _parse_project_opsgenie_teams_slow(data: Any) -> OpsgenieTeamsConnection:
+    # Slow path: walk the response level by level to report the first missing or mistyped object.
+{"".join(checks)}\
+    return OpsgenieTeamsConnection.from_dict(inner, "{parent_path}", "{keys[-1]}")
+
+
+def parse_project_opsgenie_teams(data: Any) -> OpsgenieTeamsConnection:
+    try:
+        inner = {lookup}
+    except (KeyError, TypeError):
+        inner = None
+    if inner is None:
+        return _parse_project_opsgenie_teams_slow(data)
+    return OpsgenieTeamsConnection.from_dict(inner, "{parent_path}", "{keys[-1]}")
+"""
+
+
+def _render_python(cfg: _Config) -> List[str]:
+    """Render the generated module as a list of text segments, in file order."""
+    return [
+        f"""\
 # Code generated by python/tools/generate_jira_project_models.py. DO NOT EDIT.
 from __future__ import annotations
 
+import functools
+import itertools
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING
 
 from atlassian.errors import SerializationError
 
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+    _T = TypeVar("_T")
+
 PAGEINFO_HAS_END_CURSOR = {str(cfg.pageinfo_has_end_cursor)}
 PROJECTS_EDGE_HAS_CURSOR = {str(cfg.projects_edge_has_cursor)}
 OPSGENIE_EDGE_HAS_CURSOR = {str(cfg.ops_edge_has_cursor)}
 PROJECT_HAS_ID = {str(cfg.project_has_id)}
-REFETCH_STRATEGY = {cfg.refetch_strategy!r}
+REFETCH_STRATEGY = "{cfg.refetch_strategy}"
+
+""",
+        "JIRA_PROJECTS_PAGE_QUERY_TEMPLATE = " + _triple_quoted(_render_projects_page_query(cfg)) + "\n\n",
+        "JIRA_PROJECT_OPSGENIE_TEAMS_PAGE_QUERY = " + _triple_quoted(_render_ops_query(cfg)) + "\n",
+        f"""\
+
 
-JIRA_PROJECTS_PAGE_QUERY_TEMPLATE = {projects_page_query_template!r}
-JIRA_PROJECT_OPSGENIE_TEAMS_PAGE_QUERY = {ops_query!r}
+_PROJECT_TYPE_RE = re.compile(r"[A-Z][A-Z0-9_]*")
 
 
 def build_jira_projects_page_query(project_types: Sequence[str]) -> str:
     if not project_types:
         raise ValueError("project_types must be non-empty")
-    cleaned: List[str] = []
-    for raw in project_types:
+    raw_types = tuple(project_types)
+    for raw in raw_types:
         if not isinstance(raw, str):
             raise ValueError("project_types must be strings")
+    return _projects_page_query_for(raw_types)
+
+
+@functools.lru_cache(maxsize=32)
+def _projects_page_query_for(raw_types: Tuple[str, ...]) -> str:
+    # Keyed on the caller's raw tokens so repeated calls skip normalization too.
+    cleaned: List[str] = []
+    for raw in raw_types:
         value = raw.strip().upper()
-        if not value or not value.replace("_", "").isalnum() or not value[0].isalpha():
-            raise ValueError(f"invalid Jira project type enum token: {raw!r}")
+        if not _PROJECT_TYPE_RE.fullmatch(value):
+            raise ValueError(f"invalid Jira project type enum token: {{raw!r}}")
         cleaned.append(value)
-    joined = ", ".join(cleaned)
-    return JIRA_PROJECTS_PAGE_QUERY_TEMPLATE.replace("__PROJECT_TYPES__", joined)
+    return JIRA_PROJECTS_PAGE_QUERY_TEMPLATE.replace("__PROJECT_TYPES__", ", ".join(cleaned))
 
 
-def _expect_dict(obj: Any, path: str) -> Dict[str, Any]:
-    if not isinstance(obj, dict):
-        raise SerializationError(f"Expected object at {{path}}")
-    return obj
+def _path(path: str, key: Optional[str]) -> str:
+    return path if key is None else f"{{path}}.{{key}}"
 
 
-def _expect_list(obj: Any, path: str) -> List[Any]:
-    if not isinstance(obj, list):
-        raise SerializationError(f"Expected list at {{path}}")
+def _expect_dict(obj: Any, path: str, key: Optional[str] = None) -> Dict[str, Any]:
+    if not isinstance(obj, dict):
+        raise SerializationError(f"Expected object at {{_path(path, key)}}")
     return obj
 
 
-def _expect_str(obj: Any, path: str) -> str:
-    if not isinstance(obj, str):
-        raise SerializationError(f"Expected string at {{path}}")
+def _expect_list(obj: Any, path: str, key: Optional[str] = None) -> List[Any]:
+    if not isinstance(obj, list):
+        raise SerializationError(f"Expected list at {{_path(path, key)}}")
     return obj
 
 
-def _expect_bool(obj: Any, path: str) -> bool:
-    if not isinstance(obj, bool):
-        raise SerializationError(f"Expected boolean at {{path}}")
-    return obj
+def _parse_items(parse: Callable[[Any, str], _T], items: List[Any], path: str, key: str) -> List[_T]:
+    # Elements get the unindexed parent path on the happy path; indexed paths
+    # are only built when parsing fails, so the error names the failing element.
+    try:
+        return list(map(parse, items, itertools.repeat(path)))
+    except SerializationError:
+        items_path = _path(path, key)
+        for idx, item in enumerate(items):
+            parse(item, f"{{items_path}}[{{idx}}]")
+        raise
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PageInfo:
     has_next_page: bool
     end_cursor: Optional[str] = None
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "PageInfo":
-        raw = _expect_dict(obj, path)
-        has_next = _expect_bool(raw.get("hasNextPage"), f"{{path}}.hasNextPage")
-        end_cursor: Optional[str] = None
-        if PAGEINFO_HAS_END_CURSOR:
-            value = raw.get("endCursor")
-            if value is not None:
-                end_cursor = _expect_str(value, f"{{path}}.endCursor")
-        return PageInfo(has_next_page=has_next, end_cursor=end_cursor)
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "PageInfo":
+        raw = _expect_dict(obj, path, key)
+        has_next = raw.get("hasNextPage")
+        if not isinstance(has_next, bool):
+            raise SerializationError(f"Expected boolean at {{_path(path, key)}}.hasNextPage")
+{_optional_str_check(cfg.pageinfo_has_end_cursor, "end_cursor", "endCursor", "_path(path, key)")}\
+        return PageInfo(has_next_page=has_next{", end_cursor=end_cursor" if cfg.pageinfo_has_end_cursor else ""})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpsgenieTeamNode:
     id: str
     name: str
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "OpsgenieTeamNode":
-        raw = _expect_dict(obj, path)
-        return OpsgenieTeamNode(
-            id=_expect_str(raw.get("id"), f"{{path}}.id"),
-            name=_expect_str(raw.get("name"), f"{{path}}.name"),
-        )
-
-
-@dataclass(frozen=True)
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "OpsgenieTeamNode":
+        raw = _expect_dict(obj, path, key)
+        team_id = raw.get("id")
+        if not isinstance(team_id, str):
+            raise SerializationError(f"Expected string at {{_path(path, key)}}.id")
+        name = raw.get("name")
+        if not isinstance(name, str):
+            raise SerializationError(f"Expected string at {{_path(path, key)}}.name")
+        return OpsgenieTeamNode(id=team_id, name=name)
+
+
+@dataclass(frozen=True, slots=True)
 class OpsgenieTeamEdge:
     cursor: Optional[str]
     node: OpsgenieTeamNode
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "OpsgenieTeamEdge":
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "OpsgenieTeamEdge":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
-        cursor: Optional[str] = None
-        if OPSGENIE_EDGE_HAS_CURSOR:
-            value = raw.get("cursor")
-            if value is not None:
-                cursor = _expect_str(value, f"{{path}}.cursor")
-        node = OpsgenieTeamNode.from_dict(raw.get("node"), f"{{path}}.node")
-        return OpsgenieTeamEdge(cursor=cursor, node=node)
+{_optional_str_check(cfg.ops_edge_has_cursor, "cursor", "cursor")}\
+        node = OpsgenieTeamNode.from_dict(raw.get("node"), path, "node")
+        return OpsgenieTeamEdge(cursor={"cursor" if cfg.ops_edge_has_cursor else "None"}, node=node)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpsgenieTeamsConnection:
     page_info: PageInfo
     edges: List[OpsgenieTeamEdge]
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "OpsgenieTeamsConnection":
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "OpsgenieTeamsConnection":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
-        page_info = PageInfo.from_dict(raw.get("pageInfo"), f"{{path}}.pageInfo")
-        edges_list = _expect_list(raw.get("edges"), f"{{path}}.edges")
-        edges = [
-            OpsgenieTeamEdge.from_dict(item, f"{{path}}.edges[{{idx}}]")
-            for idx, item in enumerate(edges_list)
-        ]
+        page_info = PageInfo.from_dict(raw.get("pageInfo"), path, "pageInfo")
+        edges = _parse_items(OpsgenieTeamEdge.from_dict, _expect_list(raw.get("edges"), path, "edges"), path, "edges")
         return OpsgenieTeamsConnection(page_info=page_info, edges=edges)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraProjectNode:
     id: Optional[str]
     key: str
@@ -629,67 +757,142 @@ class JiraProjectNode:
     opsgenie_teams: OpsgenieTeamsConnection
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "JiraProjectNode":
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "JiraProjectNode":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
-        project_id: Optional[str] = None
-        if PROJECT_HAS_ID:
-            value = raw.get("id")
-            if value is not None:
-                project_id = _expect_str(value, f"{{path}}.id")
+{_optional_str_check(cfg.project_has_id, "project_id", "id")}\
+        project_key = raw.get("key")
+        if not isinstance(project_key, str):
+            raise SerializationError(f"Expected string at {{path}}.key")
+        name = raw.get("name")
+        if not isinstance(name, str):
+            raise SerializationError(f"Expected string at {{path}}.name")
         return JiraProjectNode(
-            id=project_id,
-            key=_expect_str(raw.get("key"), f"{{path}}.key"),
-            name=_expect_str(raw.get("name"), f"{{path}}.name"),
-            opsgenie_teams=OpsgenieTeamsConnection.from_dict(
-                raw.get("opsgenieTeams"), f"{{path}}.opsgenieTeams"
-            ),
+            id={"project_id" if cfg.project_has_id else "None"},
+            key=project_key,
+            name=name,
+            opsgenie_teams=OpsgenieTeamsConnection.from_dict(raw.get("opsgenieTeams"), path, "opsgenieTeams"),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraProjectEdge:
     cursor: Optional[str]
     node: JiraProjectNode
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "JiraProjectEdge":
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "JiraProjectEdge":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
-        cursor: Optional[str] = None
-        if PROJECTS_EDGE_HAS_CURSOR:
-            value = raw.get("cursor")
-            if value is not None:
-                cursor = _expect_str(value, f"{{path}}.cursor")
-        node = JiraProjectNode.from_dict(raw.get("node"), f"{{path}}.node")
-        return JiraProjectEdge(cursor=cursor, node=node)
+{_optional_str_check(cfg.projects_edge_has_cursor, "cursor", "cursor")}\
+        node = JiraProjectNode.from_dict(raw.get("node"), path, "node")
+        return JiraProjectEdge(cursor={"cursor" if cfg.projects_edge_has_cursor else "None"}, node=node)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraProjectsConnection:
     page_info: PageInfo
     edges: List[JiraProjectEdge]
 
     @staticmethod
-    def from_dict(obj: Any, path: str) -> "JiraProjectsConnection":
+    def from_dict(obj: Any, path: str, key: Optional[str] = None) -> "JiraProjectsConnection":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
-        page_info = PageInfo.from_dict(raw.get("pageInfo"), f"{{path}}.pageInfo")
-        edges_list = _expect_list(raw.get("edges"), f"{{path}}.edges")
-        edges = [
-            JiraProjectEdge.from_dict(item, f"{{path}}.edges[{{idx}}]")
-            for idx, item in enumerate(edges_list)
-        ]
+        page_info = PageInfo.from_dict(raw.get("pageInfo"), path, "pageInfo")
+        edges = _parse_items(JiraProjectEdge.from_dict, _expect_list(raw.get("edges"), path, "edges"), path, "edges")
         return JiraProjectsConnection(page_info=page_info, edges=edges)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraProjectsPageData:
     projects: JiraProjectsConnection
 
     @staticmethod
-    def from_dict(obj: Any, path: str = "data.jira") -> "JiraProjectsPageData":
+    def from_dict(obj: Any, path: str = "data.jira", key: Optional[str] = None) -> "JiraProjectsPageData":
+        path = _path(path, key)
         raw = _expect_dict(obj, path)
         return JiraProjectsPageData(
-            projects=JiraProjectsConnection.from_dict(raw.get("projects"), f"{{path}}.projects"),
+            projects=JiraProjectsConnection.from_dict(raw.get("projects"), path, "projects"),
+        )
+
+
+class _FastPathMiss(Exception):
+    pass
+
+
+def _page_info_fast(obj: Any) -> PageInfo:
+    if not isinstance(obj, dict):
+        raise _FastPathMiss
+    has_next = obj.get("hasNextPage")
+    if not isinstance(has_next, bool):
+        raise _FastPathMiss
+{_fast_optional_str(cfg.pageinfo_has_end_cursor, "end_cursor", "obj.get", "endCursor", 4)}\
+    return PageInfo(has_next_page=has_next{", end_cursor=end_cursor" if cfg.pageinfo_has_end_cursor else ""})
+
+
+def _parse_jira_projects_page_fast(jira: Any) -> JiraProjectsPageData:
+    # One pass over the page without per-level from_dict calls. Any mismatch
+    # raises _FastPathMiss; the caller re-parses via from_dict for the error path.
+    if not isinstance(jira, dict):
+        raise _FastPathMiss
+    projects = jira.get("projects")
+    if not isinstance(projects, dict):
+        raise _FastPathMiss
+    project_edges = projects.get("edges")
+    if not isinstance(project_edges, list):
+        raise _FastPathMiss
+    edges: List[JiraProjectEdge] = []
+    for edge in project_edges:
+        if not isinstance(edge, dict):
+            raise _FastPathMiss
+{_fast_optional_str(cfg.projects_edge_has_cursor, "cursor", "edge.get", "cursor", 8)}\
+        node = edge.get("node")
+        if not isinstance(node, dict):
+            raise _FastPathMiss
+        node_get = node.get
+{_fast_optional_str(cfg.project_has_id, "project_id", "node_get", "id", 8)}\
+        project_key = node_get("key")
+        name = node_get("name")
+        if not isinstance(project_key, str) or not isinstance(name, str):
+            raise _FastPathMiss
+        teams = node_get("opsgenieTeams")
+        if not isinstance(teams, dict):
+            raise _FastPathMiss
+        team_edges = teams.get("edges")
+        if not isinstance(team_edges, list):
+            raise _FastPathMiss
+        team_page_info = _page_info_fast(teams.get("pageInfo"))
+        parsed_team_edges: List[OpsgenieTeamEdge] = []
+        for team_edge in team_edges:
+            if not isinstance(team_edge, dict):
+                raise _FastPathMiss
+{_fast_optional_str(cfg.ops_edge_has_cursor, "team_cursor", "team_edge.get", "cursor", 12)}\
+            team = team_edge.get("node")
+            if not isinstance(team, dict):
+                raise _FastPathMiss
+            team_id = team.get("id")
+            team_name = team.get("name")
+            if not isinstance(team_id, str) or not isinstance(team_name, str):
+                raise _FastPathMiss
+            parsed_team_edges.append(
+                OpsgenieTeamEdge(
+                    cursor={"team_cursor" if cfg.ops_edge_has_cursor else "None"},
+                    node=OpsgenieTeamNode(id=team_id, name=team_name),
+                )
+            )
+        edges.append(
+            JiraProjectEdge(
+                cursor={"cursor" if cfg.projects_edge_has_cursor else "None"},
+                node=JiraProjectNode(
+                    id={"project_id" if cfg.project_has_id else "None"},
+                    key=project_key,
+                    name=name,
+                    opsgenie_teams=OpsgenieTeamsConnection(page_info=team_page_info, edges=parsed_team_edges),
+                ),
+            )
         )
+    page_info = _page_info_fast(projects.get("pageInfo"))
+    return JiraProjectsPageData(projects=JiraProjectsConnection(page_info=page_info, edges=edges))
 
 
 def parse_jira_projects_page(data: Any) -> JiraProjectsPageData:
@@ -697,41 +900,47 @@ def parse_jira_projects_page(data: Any) -> JiraProjectsPageData:
     jira = root.get("jira")
     if jira is None:
         raise SerializationError("Missing data.jira")
+    try:
+        return _parse_jira_projects_page_fast(jira)
+    except _FastPathMiss:
+        pass
     return JiraProjectsPageData.from_dict(jira, "data.jira")
 
 
-def parse_project_opsgenie_teams(data: Any) -> OpsgenieTeamsConnection:
-    root = _expect_dict(data, "data")
-    if REFETCH_STRATEGY == "node":
-        project = root.get("project")
-        if project is None:
-            raise SerializationError("Missing data.project")
-        project_obj = _expect_dict(project, "data.project")
-        inner = project_obj.get("opsgenieTeams")
-        if inner is None:
-            raise SerializationError("Missing data.project.opsgenieTeams")
-        return OpsgenieTeamsConnection.from_dict(inner, "data.project.opsgenieTeams")
+""",
+        _render_opsgenie_teams_parser(cfg),
+    ]
 
-    jira = root.get("jira")
-    if jira is None:
-        raise SerializationError("Missing data.jira")
-    jira_obj = _expect_dict(jira, "data.jira")
-    project = jira_obj.get("project")
-    if project is None:
-        raise SerializationError("Missing data.jira.project")
-    project_obj = _expect_dict(project, "data.jira.project")
-    inner = project_obj.get("opsgenieTeams")
-    if inner is None:
-        raise SerializationError("Missing data.jira.project.opsgenieTeams")
-    return OpsgenieTeamsConnection.from_dict(inner, "data.jira.project.opsgenieTeams")
-"""
+
+@functools.lru_cache(maxsize=4)
+def _render_python_bytes(cfg: _Config) -> bytes:
+    return "".join(_render_python(cfg)).encode("utf-8")
+
+
+def _is_up_to_date(output: Path, *inputs: Path) -> bool:
+    """True when ``output`` exists and is not older than any of ``inputs``."""
+    try:
+        output_mtime = output.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return all(path.stat().st_mtime_ns <= output_mtime for path in inputs)
 
 
 def main(argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(description="Generate Jira project GraphQL models from the introspection schema.")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if the output is newer than its inputs")
+    args = parser.parse_args(argv)
+
     repo_root = Path(__file__).resolve().parents[2]
     schema_path = repo_root / "graphql" / "schema.introspection.json"
 
-    if not schema_path.exists():
+    try:
+        ttl_seconds = _env_schema_ttl_seconds()
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    if _schema_needs_fetch(schema_path, ttl_seconds):
         base_url = os.getenv("ATLASSIAN_GQL_BASE_URL")
         if not base_url and (
             os.getenv("ATLASSIAN_OAUTH_ACCESS_TOKEN")
@@ -744,24 +953,28 @@ def main(argv: Sequence[str]) -> int:
             print(str(exc), file=sys.stderr)
             return 2
         if not base_url or auth is None:
+            state = "Stale" if schema_path.exists() else "Missing"
             print(
-                f"Missing {schema_path}. Set ATLASSIAN_GQL_BASE_URL (required for non-OAuth auth modes) and credentials, "
+                f"{state} {schema_path}. Set ATLASSIAN_GQL_BASE_URL (required for non-OAuth auth modes) and credentials, "
                 "or run `make graphql-schema` first.",
                 file=sys.stderr,
             )
             return 2
-        fetch_schema_introspection(
-            base_url,
-            auth,
-            output_dir=schema_path.parent,
-            experimental_apis=_env_experimental_apis(),
-        )
+        _fetch_schema(schema_path, base_url, auth)
+
+    output_py = repo_root / "python" / "atlassian" / "graph" / "gen" / "jira_projects_api.py"
+    if not args.force and _is_up_to_date(output_py, schema_path, Path(__file__)):
+        print(f"Up to date: {output_py}")
+        return 0
 
     schema = _load_introspection(schema_path)
     cfg = _discover_config(schema)
-    output_py = repo_root / "python" / "atlassian" / "graph" / "gen" / "jira_projects_api.py"
+    rendered = _render_python_bytes(cfg)
+    # Reject a broken template before it replaces the checked-in module.
+    compile(rendered, str(output_py), "exec")
     output_py.parent.mkdir(parents=True, exist_ok=True)
-    output_py.write_text(_render_python(cfg), encoding="utf-8")
+    output_py.write_bytes(rendered)
+    py_compile.compile(str(output_py), doraise=True)
 
     print(f"Wrote {output_py}")
     return 0
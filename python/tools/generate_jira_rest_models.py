@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import argparse
-import json
+import pickle
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:  # optional: pip install ijson (streams only the parts of the spec the generator reads)
+    import ijson
+except ImportError:  # pragma: no cover - exercised when ijson is absent
+    ijson = None
 
 
 def _add_project_to_syspath() -> None:
@@ -15,10 +20,13 @@ def _add_project_to_syspath() -> None:
 
 _add_project_to_syspath()
 
+from atlassian import json_codec  # noqa: E402
+from atlassian.fileio import write_bytes_atomic, write_bytes_if_changed  # noqa: E402
+
 
 def _read_json(path: Path) -> Dict[str, Any]:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = json_codec.loads(path.read_bytes())
     except FileNotFoundError:
         raise FileNotFoundError(str(path))
     if not isinstance(payload, dict):
@@ -26,11 +34,151 @@ def _read_json(path: Path) -> Dict[str, Any]:
     return payload
 
 
+_SCHEMA_REF_PREFIX = "#/components/schemas/"
+
+# Paths whose GET 200 response schemas the generated models are derived from.
+_OPERATION_PATHS = frozenset(
+    {
+        "/rest/api/3/project/search",
+        "/rest/api/3/search",
+        "/rest/api/3/issue/{issueIdOrKey}/changelog",
+        "/rest/api/3/issue/{issueIdOrKey}/worklog",
+    }
+)
+
+
+def _iter_schema_refs(node: Any) -> Iterable[str]:
+    stack = [node]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            ref = cur.get("$ref")
+            if isinstance(ref, str) and ref.startswith(_SCHEMA_REF_PREFIX):
+                yield ref[len(_SCHEMA_REF_PREFIX) :]
+            stack.extend(cur.values())
+        elif isinstance(cur, list):
+            stack.extend(cur)
+
+
+# Documentation keys the generator never reads; vendor extensions (x-*) are dropped too.
+_DOC_KEYS = frozenset({"description", "summary", "example", "examples", "externalDocs"})
+# Objects whose keys are names (properties, status codes, media types), never keywords.
+_NAMED_MAPS = frozenset({"paths", "schemas", "properties", "responses", "content"})
+
+
+def _strip_docs(node: Any, named: bool = False) -> Any:
+    if isinstance(node, dict):
+        return {
+            k: _strip_docs(v, not named and k in _NAMED_MAPS)
+            for k, v in node.items()
+            if named or not (k in _DOC_KEYS or k.startswith("x-"))
+        }
+    if isinstance(node, list):
+        return [_strip_docs(v) for v in node]
+    return node
+
+
+def _schema_closure(roots: Iterable[str], refs_of: Callable[[str], Optional[Iterable[str]]]) -> Set[str]:
+    """Names reachable from ``roots``; ``refs_of`` returns None for unknown schemas."""
+    closure: Set[str] = set()
+    pending: Set[str] = set(roots)
+    while pending:
+        name = pending.pop()
+        if name in closure:
+            continue
+        refs = refs_of(name)
+        if refs is None:
+            continue
+        closure.add(name)
+        pending.update(refs)
+    return closure
+
+
+def _subset_doc(paths: Dict[str, Any], schemas: Dict[str, Any]) -> Dict[str, Any]:
+    return _strip_docs({"paths": paths, "components": {"schemas": schemas}})
+
+
+def _spec_subset(paths: Dict[str, Any], all_schemas: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the generator's operations and the schemas they reference."""
+    paths = {k: v for k, v in paths.items() if k in _OPERATION_PATHS}
+    wanted = _schema_closure(
+        _iter_schema_refs(paths),
+        lambda name: _iter_schema_refs(all_schemas[name]) if name in all_schemas else None,
+    )
+    return _subset_doc(paths, {name: schema for name, schema in all_schemas.items() if name in wanted})
+
+
+def _read_json_subset(path: Path) -> Dict[str, Any]:
+    """Stream the spec with ijson, holding one component schema at a time plus the ones kept."""
+    try:
+        with path.open("rb") as f:
+            paths = {k: v for k, v in ijson.kvitems(f, "paths", use_float=True) if k in _OPERATION_PATHS}
+        # First pass records only each schema's $ref edges; the schemas themselves are dropped.
+        with path.open("rb") as f:
+            edges = {
+                name: frozenset(_iter_schema_refs(schema))
+                for name, schema in ijson.kvitems(f, "components.schemas", use_float=True)
+            }
+        wanted = _schema_closure(_iter_schema_refs(paths), edges.get)
+        with path.open("rb") as f:
+            schemas = {
+                name: schema
+                for name, schema in ijson.kvitems(f, "components.schemas", use_float=True)
+                if name in wanted
+            }
+    except FileNotFoundError:
+        raise FileNotFoundError(str(path))
+    except ijson.JSONError as exc:
+        raise ValueError(f"Invalid OpenAPI JSON: {exc}") from exc
+    return _subset_doc(paths, schemas)
+
+
+def _load_spec(path: Path) -> Dict[str, Any]:
+    if ijson is not None:
+        return _read_json_subset(path)
+    doc = _read_json(path)
+    paths = doc.get("paths")
+    schemas = doc.get("components", {}).get("schemas")
+    if not isinstance(paths, dict) or not isinstance(schemas, dict):
+        # Let _generate report exactly what is missing.
+        return doc
+    return _spec_subset(paths, schemas)
+
+
+# Bump when the shape of the cached subset changes.
+_SPEC_CACHE_VERSION = 2
+
+
+def _spec_cache_path(spec: Path) -> Path:
+    return spec.with_suffix(".cache.pkl")
+
+
+def _load_spec_cached(spec: Path) -> Dict[str, Any]:
+    """Load the spec subset, reusing a pickle next to the spec while its mtime and size are unchanged."""
+    try:
+        st = spec.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(str(spec))
+    key: Tuple[int, int, int] = (_SPEC_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    cache_path = _spec_cache_path(spec)
+    try:
+        cached_key, subset = pickle.loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (pickle.UnpicklingError, EOFError, TypeError, ValueError):
+        print(f"Ignoring unreadable spec cache {cache_path}", file=sys.stderr)
+    else:
+        if cached_key == key:
+            return subset
+    subset = _load_spec(spec)
+    write_bytes_atomic(cache_path, pickle.dumps((key, subset), protocol=5))
+    return subset
+
+
 def _ref_name(ref: str) -> str:
-    prefix = "#/components/schemas/"
-    if not isinstance(ref, str) or not ref.startswith(prefix):
+    if not isinstance(ref, str) or not ref.startswith(_SCHEMA_REF_PREFIX):
         raise ValueError(f"Unsupported $ref: {ref!r}")
-    return ref[len(prefix) :]
+    return ref[len(_SCHEMA_REF_PREFIX) :]
 
 
 def _get_schema(doc: Dict[str, Any], name: str) -> Dict[str, Any]:
@@ -106,6 +254,137 @@ def _property_ref(prop_schema: Dict[str, Any]) -> str:
     raise ValueError("Property schema does not contain a supported $ref/allOf")
 
 
+@dataclass(frozen=True)
+class _FieldSpec:
+    attr: str
+    key: str
+    # "str" | "int" | "bool": optional scalar; "model": optional nested model;
+    # "list": list of models (missing -> []); "object": free-form dict (missing -> {}).
+    kind: str
+    local: Optional[str] = None
+    model: Optional[str] = None
+    default_none: bool = False
+
+    @property
+    def var(self) -> str:
+        return self.local or self.attr
+
+
+@dataclass(frozen=True)
+class _ModelSpec:
+    name: str
+    fields: Tuple[_FieldSpec, ...]
+    # from_dict parse order by attr; defaults to declaration order.
+    parse_order: Optional[Tuple[str, ...]] = None
+    inline_return: bool = False
+    # Emit from_json_bytes and a streaming iterator for top-level response models.
+    response: bool = False
+
+
+_SCALAR_KINDS = ("str", "int", "bool")
+
+
+def _page_fields(*, with_is_last: bool) -> Tuple[_FieldSpec, ...]:
+    fields = (
+        _FieldSpec("start_at", "startAt", "int"),
+        _FieldSpec("max_results", "maxResults", "int"),
+        _FieldSpec("total", "total", "int"),
+    )
+    if with_is_last:
+        fields += (_FieldSpec("is_last", "isLast", "bool"),)
+    return fields
+
+
+def _annotation(field: _FieldSpec) -> str:
+    if field.kind in _SCALAR_KINDS:
+        return f"Optional[{field.kind}]"
+    if field.kind == "model":
+        return f"Optional[{field.model}]"
+    if field.kind == "list":
+        return f"List[{field.model}]"
+    if field.kind == "object":
+        return "Dict[str, Any]"
+    raise ValueError(f"Unknown field kind: {field.kind!r}")
+
+
+def _render_parse(field: _FieldSpec) -> str:
+    var, key = field.var, field.key
+    path = f'f"{{path}}.{key}"'
+    if field.kind in _SCALAR_KINDS or field.kind == "model":
+        if field.kind == "model":
+            value = f"{field.model}.from_dict({var}, {path})"
+        else:
+            value = f"_expect_{field.kind}({var}, {path})"
+        return (
+            f'        {var} = raw_get("{key}")\n'
+            f"        if {var} is not None:\n"
+            f"            {var} = {value}\n"
+        )
+    if field.kind == "list":
+        return (
+            f'        {var}_raw = raw_get("{key}")\n'
+            f"        {var}_list = _expect_list({var}_raw, {path}) if {var}_raw is not None else []\n"
+            f"        {var} = _parse_items({field.model}.from_dict, {var}_list, {path})\n"
+        )
+    if field.kind == "object":
+        return (
+            f'        {var}_raw = raw_get("{key}")\n'
+            f"        {var} = _expect_obj({var}_raw, {path}) if {var}_raw is not None else {{}}\n"
+        )
+    raise ValueError(f"Unknown field kind: {field.kind!r}")
+
+
+def _render_model(model: _ModelSpec) -> str:
+    by_attr = {field.attr: field for field in model.fields}
+    parse_fields = [by_attr[attr] for attr in model.parse_order] if model.parse_order else model.fields
+    declarations = "".join(
+        f"    {field.attr}: {_annotation(field)}{' = None' if field.default_none else ''}\n"
+        for field in model.fields
+    )
+    parse = "".join(_render_parse(field) for field in parse_fields)
+    if model.inline_return:
+        args = ", ".join(f"{field.attr}={field.var}" for field in model.fields)
+        ret = f"        return {model.name}({args})\n"
+    else:
+        args = "".join(f"            {field.attr}={field.var},\n" for field in model.fields)
+        ret = f"        return {model.name}(\n{args}        )\n"
+    response_methods = ""
+    if model.response:
+        response_methods = (
+            "\n"
+            "    @staticmethod\n"
+            f'    def from_json_bytes(data: bytes, path: str = "data") -> "{model.name}":\n'
+            "        try:\n"
+            "            obj = json_codec.loads(data)\n"
+            "        except ValueError as exc:\n"
+            '            raise SerializationError(f"Failed to parse JSON: {exc}") from exc\n'
+            f"        return {model.name}.from_dict(obj, path)\n"
+        )
+        (items,) = [field for field in model.fields if field.kind == "list"]
+        scalars = [field for field in model.fields if field.kind in _SCALAR_KINDS]
+        if len(scalars) + 1 != len(model.fields):
+            raise ValueError(f"Streaming {model.name} supports only scalar fields besides {items.attr}")
+        checks = "".join(f'            "{field.key}": _expect_{field.kind},\n' for field in scalars)
+        response_methods += (
+            "\n"
+            "    @staticmethod\n"
+            f'    def iter_{items.attr}_from_stream(fp: IO[bytes], path: str = "data") -> Iterator[{items.model}]:\n'
+            f"        scalars = {{\n{checks}        }}\n"
+            f'        for item, item_path in _stream_items(fp, path, "{items.key}", scalars):\n'
+            f"            yield {items.model}.from_dict(item, item_path)\n"
+        )
+    return (
+        "@dataclass(frozen=True, slots=True)\n"
+        f"class {model.name}:\n"
+        f"{declarations}\n"
+        "    @staticmethod\n"
+        f'    def from_dict(obj: Any, path: str) -> "{model.name}":\n'
+        "        raw = _expect_dict(obj, path)\n"
+        "        raw_get = raw.get\n"
+        f"{parse}{ret}{response_methods}\n"
+    )
+
+
 def _generate(doc: Dict[str, Any]) -> str:
     page_projects_ref = _get_operation_schema_ref(
         doc, path="/rest/api/3/project/search", method="get"
@@ -164,28 +443,29 @@ def _generate(doc: Dict[str, Any]) -> str:
         )
 
     # Ensure the properties we rely on exist in the derived schemas.
-    for prop in ("startAt", "maxResults", "total"):
-        _expect_property(_get_schema(doc, page_worklogs_name), prop)
-    for prop in ("key", "name", "projectTypeKey"):
-        _expect_property(_get_schema(doc, project_name), prop)
-    for prop in ("id", "key", "fields"):
-        _expect_property(_get_schema(doc, issue_name), prop if prop != "fields" else "fields")
-    for prop in ("id", "created", "items"):
-        _expect_property(_get_schema(doc, changelog_name), prop)
-    for prop in ("field", "from", "to", "fromString", "toString"):
-        _expect_property(_get_schema(doc, change_details_name), prop)
-    for prop in ("accountId", "displayName", "emailAddress"):
-        _expect_property(_get_schema(doc, user_details_name), prop)
-    for prop in ("id", "started", "timeSpentSeconds", "created", "updated", "author"):
-        _expect_property(_get_schema(doc, worklog_name), prop)
+    required_properties = (
+        (page_worklogs_schema, ("startAt", "maxResults", "total")),
+        (_get_schema(doc, project_name), ("key", "name", "projectTypeKey")),
+        (_get_schema(doc, issue_name), ("id", "key", "fields")),
+        (changelog_schema, ("id", "created", "items")),
+        (_get_schema(doc, change_details_name), ("field", "from", "to", "fromString", "toString")),
+        (_get_schema(doc, user_details_name), ("accountId", "displayName", "emailAddress")),
+        (worklog_schema, ("id", "started", "timeSpentSeconds", "created", "updated", "author")),
+    )
+    for schema, props in required_properties:
+        for prop in props:
+            _expect_property(schema, prop)
 
     # Deterministic output. Do not import this module from the generator.
     header = (
         "# Code generated by python/tools/generate_jira_rest_models.py. DO NOT EDIT.\n"
         "from __future__ import annotations\n\n"
+        "import itertools\n"
         "from dataclasses import dataclass\n"
-        "from typing import Any, Dict, List, Optional\n\n"
+        "from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar\n\n"
+        "from atlassian import json_codec\n"
         "from atlassian.errors import SerializationError\n\n"
+        '_T = TypeVar("_T")\n\n\n'
     )
 
     helpers = """\
@@ -201,20 +481,22 @@ def _expect_list(obj: Any, path: str) -> List[Any]:
     return obj
 
 
+# JSON decoding only yields exact str/bool/int, so scalar checks compare the
+# type directly; that also keeps bools out of _expect_int.
 def _expect_str(obj: Any, path: str) -> str:
-    if not isinstance(obj, str):
+    if type(obj) is not str:
         raise SerializationError(f"Expected string at {path}")
     return obj
 
 
 def _expect_bool(obj: Any, path: str) -> bool:
-    if not isinstance(obj, bool):
+    if type(obj) is not bool:
         raise SerializationError(f"Expected boolean at {path}")
     return obj
 
 
 def _expect_int(obj: Any, path: str) -> int:
-    if isinstance(obj, bool) or not isinstance(obj, int):
+    if type(obj) is not int:
         raise SerializationError(f"Expected integer at {path}")
     return obj
 
@@ -223,386 +505,140 @@ def _expect_obj(obj: Any, path: str) -> Dict[str, Any]:
     # Jira issue fields are modeled as a free-form object in the OpenAPI spec.
     return _expect_dict(obj, path)
 
-"""
-
-    models: List[str] = []
-
-    # UserDetails
-    models.append(
-        f"""\
-@dataclass(frozen=True)
-class {user_details_name}:
-    account_id: Optional[str]
-    display_name: Optional[str]
-    email_address: Optional[str] = None
-
-    @staticmethod
-    def from_dict(obj: Any, path: str) -> "{user_details_name}":
-        raw = _expect_dict(obj, path)
-        account_id: Optional[str] = None
-        if raw.get("accountId") is not None:
-            account_id = _expect_str(raw.get("accountId"), f"{{path}}.accountId")
-        display_name: Optional[str] = None
-        if raw.get("displayName") is not None:
-            display_name = _expect_str(raw.get("displayName"), f"{{path}}.displayName")
-        email_address: Optional[str] = None
-        if raw.get("emailAddress") is not None:
-            email_address = _expect_str(raw.get("emailAddress"), f"{{path}}.emailAddress")
-        return {user_details_name}(
-            account_id=account_id,
-            display_name=display_name,
-            email_address=email_address,
-        )
-
-"""
-    )
-
-    # Project
-    models.append(
-        f"""\
-@dataclass(frozen=True)
-class {project_name}:
-    id: Optional[str]
-    key: Optional[str]
-    name: Optional[str]
-    project_type_key: Optional[str] = None
-
-    @staticmethod
-    def from_dict(obj: Any, path: str) -> "{project_name}":
-        raw = _expect_dict(obj, path)
-        project_id: Optional[str] = None
-        if raw.get("id") is not None:
-            project_id = _expect_str(raw.get("id"), f"{{path}}.id")
-        key: Optional[str] = None
-        if raw.get("key") is not None:
-            key = _expect_str(raw.get("key"), f"{{path}}.key")
-        name: Optional[str] = None
-        if raw.get("name") is not None:
-            name = _expect_str(raw.get("name"), f"{{path}}.name")
-        project_type_key: Optional[str] = None
-        if raw.get("projectTypeKey") is not None:
-            project_type_key = _expect_str(raw.get("projectTypeKey"), f"{{path}}.projectTypeKey")
-        return {project_name}(
-            id=project_id,
-            key=key,
-            name=name,
-            project_type_key=project_type_key,
-        )
-
-"""
-    )
-
-    # PageBeanProject
-    models.append(
-        f"""\
-@dataclass(frozen=True)
-class {page_projects_name}:
-    start_at: Optional[int]
-    max_results: Optional[int]
-    total: Optional[int]
-    is_last: Optional[bool]
-    values: List[{project_name}]
-
-    @staticmethod
-    def from_dict(obj: Any, path: str) -> "{page_projects_name}":
-        raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{{path}}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{{path}}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{{path}}.total")
-        is_last: Optional[bool] = None
-        if raw.get("isLast") is not None:
-            is_last = _expect_bool(raw.get("isLast"), f"{{path}}.isLast")
-        values_raw = raw.get("values")
-        values_list = _expect_list(values_raw, f"{{path}}.values") if values_raw is not None else []
-        values = [
-            {project_name}.from_dict(item, f"{{path}}.values[{{idx}}]")
-            for idx, item in enumerate(values_list)
-        ]
-        return {page_projects_name}(
-            start_at=start_at,
-            max_results=max_results,
-            total=total,
-            is_last=is_last,
-            values=values,
-        )
-
-"""
-    )
-
-    # IssueBean
-    models.append(
-        f"""\
-@dataclass(frozen=True)
-class {issue_name}:
-    id: Optional[str]
-    key: Optional[str]
-    fields: Dict[str, Any]
-
-    @staticmethod
-    def from_dict(obj: Any, path: str) -> "{issue_name}":
-        raw = _expect_dict(obj, path)
-        issue_id: Optional[str] = None
-        if raw.get("id") is not None:
-            issue_id = _expect_str(raw.get("id"), f"{{path}}.id")
-        key: Optional[str] = None
-        if raw.get("key") is not None:
-            key = _expect_str(raw.get("key"), f"{{path}}.key")
-        fields_raw = raw.get("fields")
-        fields = _expect_obj(fields_raw, f"{{path}}.fields") if fields_raw is not None else {{}}
-        return {issue_name}(id=issue_id, key=key, fields=fields)
-
-"""
-    )
-
-    # SearchResults
-    models.append(
-        f"""\
-@dataclass(frozen=True)
-class {search_results_name}:
-    start_at: Optional[int]
-    max_results: Optional[int]
-    total: Optional[int]
-    issues: List[{issue_name}]
-
-    @staticmethod
-    def from_dict(obj: Any, path: str) -> "{search_results_name}":
-        raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{{path}}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{{path}}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{{path}}.total")
-        issues_raw = raw.get("issues")
-        issues_list = _expect_list(issues_raw, f"{{path}}.issues") if issues_raw is not None else []
-        issues = [
-            {issue_name}.from_dict(item, f"{{path}}.issues[{{idx}}]")
-            for idx, item in enumerate(issues_list)
-        ]
-        return {search_results_name}(
-            start_at=start_at,
-            max_results=max_results,
-            total=total,
-            issues=issues,
-        )
-
-"""
-    )
-
-    # ChangeDetails
-    models.append(
-        f"""\
-@dataclass(frozen=True)
-class {change_details_name}:
-    field: Optional[str]
-    from_value: Optional[str] = None
-    to_value: Optional[str] = None
-    from_string: Optional[str] = None
-    to_string: Optional[str] = None
-
-    @staticmethod
-    def from_dict(obj: Any, path: str) -> "{change_details_name}":
-        raw = _expect_dict(obj, path)
-        field: Optional[str] = None
-        if raw.get("field") is not None:
-            field = _expect_str(raw.get("field"), f"{{path}}.field")
-        from_value: Optional[str] = None
-        if raw.get("from") is not None:
-            from_value = _expect_str(raw.get("from"), f"{{path}}.from")
-        to_value: Optional[str] = None
-        if raw.get("to") is not None:
-            to_value = _expect_str(raw.get("to"), f"{{path}}.to")
-        from_string: Optional[str] = None
-        if raw.get("fromString") is not None:
-            from_string = _expect_str(raw.get("fromString"), f"{{path}}.fromString")
-        to_string: Optional[str] = None
-        if raw.get("toString") is not None:
-            to_string = _expect_str(raw.get("toString"), f"{{path}}.toString")
-        return {change_details_name}(
-            field=field,
-            from_value=from_value,
-            to_value=to_value,
-            from_string=from_string,
-            to_string=to_string,
-        )
-
-"""
-    )
-
-    # Changelog
-    models.append(
-        f"""\
-@dataclass(frozen=True)
-class {changelog_name}:
-    id: Optional[str]
-    created: Optional[str]
-    items: List[{change_details_name}]
-    author: Optional[{user_details_name}] = None
-
-    @staticmethod
-    def from_dict(obj: Any, path: str) -> "{changelog_name}":
-        raw = _expect_dict(obj, path)
-        event_id: Optional[str] = None
-        if raw.get("id") is not None:
-            event_id = _expect_str(raw.get("id"), f"{{path}}.id")
-        created: Optional[str] = None
-        if raw.get("created") is not None:
-            created = _expect_str(raw.get("created"), f"{{path}}.created")
-        author: Optional[{user_details_name}] = None
-        if raw.get("author") is not None:
-            author = {user_details_name}.from_dict(raw.get("author"), f"{{path}}.author")
-        items_raw = raw.get("items")
-        items_list = _expect_list(items_raw, f"{{path}}.items") if items_raw is not None else []
-        items = [
-            {change_details_name}.from_dict(item, f"{{path}}.items[{{idx}}]")
-            for idx, item in enumerate(items_list)
-        ]
-        return {changelog_name}(
-            id=event_id,
-            created=created,
-            items=items,
-            author=author,
-        )
-
-"""
-    )
-
-    # PageBeanChangelog
-    models.append(
-        f"""\
-@dataclass(frozen=True)
-class {page_changelog_name}:
-    start_at: Optional[int]
-    max_results: Optional[int]
-    total: Optional[int]
-    is_last: Optional[bool]
-    values: List[{changelog_name}]
-
-    @staticmethod
-    def from_dict(obj: Any, path: str) -> "{page_changelog_name}":
-        raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{{path}}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{{path}}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{{path}}.total")
-        is_last: Optional[bool] = None
-        if raw.get("isLast") is not None:
-            is_last = _expect_bool(raw.get("isLast"), f"{{path}}.isLast")
-        values_raw = raw.get("values")
-        values_list = _expect_list(values_raw, f"{{path}}.values") if values_raw is not None else []
-        values = [
-            {changelog_name}.from_dict(item, f"{{path}}.values[{{idx}}]")
-            for idx, item in enumerate(values_list)
-        ]
-        return {page_changelog_name}(
-            start_at=start_at,
-            max_results=max_results,
-            total=total,
-            is_last=is_last,
-            values=values,
-        )
 
-"""
-    )
+def _parse_items(parse: Callable[[Any, str], _T], items: List[Any], path: str) -> List[_T]:
+    # Elements get the list path on the happy path; indexed paths are only
+    # built when parsing fails, so the error names the failing element.
+    try:
+        return list(map(parse, items, itertools.repeat(path)))
+    except SerializationError:
+        for idx, item in enumerate(items):
+            parse(item, f"{path}[{idx}]")
+        raise
 
-    # Worklog
-    models.append(
-        f"""\
-@dataclass(frozen=True)
-class {worklog_name}:
-    id: Optional[str]
-    started: Optional[str]
-    time_spent_seconds: Optional[int]
-    created: Optional[str]
-    updated: Optional[str]
-    author: Optional[{user_details_name}] = None
-
-    @staticmethod
-    def from_dict(obj: Any, path: str) -> "{worklog_name}":
-        raw = _expect_dict(obj, path)
-        worklog_id: Optional[str] = None
-        if raw.get("id") is not None:
-            worklog_id = _expect_str(raw.get("id"), f"{{path}}.id")
-        started: Optional[str] = None
-        if raw.get("started") is not None:
-            started = _expect_str(raw.get("started"), f"{{path}}.started")
-        time_spent_seconds: Optional[int] = None
-        if raw.get("timeSpentSeconds") is not None:
-            time_spent_seconds = _expect_int(raw.get("timeSpentSeconds"), f"{{path}}.timeSpentSeconds")
-        created: Optional[str] = None
-        if raw.get("created") is not None:
-            created = _expect_str(raw.get("created"), f"{{path}}.created")
-        updated: Optional[str] = None
-        if raw.get("updated") is not None:
-            updated = _expect_str(raw.get("updated"), f"{{path}}.updated")
-        author: Optional[{user_details_name}] = None
-        if raw.get("author") is not None:
-            author = {user_details_name}.from_dict(raw.get("author"), f"{{path}}.author")
-        return {worklog_name}(
-            id=worklog_id,
-            started=started,
-            time_spent_seconds=time_spent_seconds,
-            created=created,
-            updated=updated,
-            author=author,
-        )
 
-"""
-    )
+def _import_ijson() -> Any:
+    # Only the streaming parsers need ijson (pip install atlassian-client[codegen]).
+    try:
+        import ijson
+    except ImportError as exc:
+        raise ImportError("Streaming parsing requires ijson: pip install atlassian-client[codegen]") from exc
+    return ijson
+
+
+def _stream_items(
+    fp: IO[bytes],
+    path: str,
+    key: str,
+    scalars: Dict[str, Callable[[Any, str], Any]],
+) -> Iterator[Tuple[Any, str]]:
+    # Yields the elements of the top-level list `key` one at a time, enforcing the
+    # envelope from_dict would: an object whose `key` is a list, null or absent, and
+    # whose scalar fields pass their `scalars` check (null allowed) as they stream by.
+    ijson = _import_ijson()
+    items_path = f"{path}.{key}"
+
+    def events() -> Iterator[Tuple[str, str, Any]]:
+        for prefix, event, value in ijson.parse(fp, use_float=True):
+            if not prefix and event not in ("start_map", "map_key", "end_map"):
+                raise SerializationError(f"Expected object at {path}")
+            if prefix == key and event not in ("start_array", "end_array", "null"):
+                raise SerializationError(f"Expected list at {items_path}")
+            check = scalars.get(prefix)
+            if check is not None and event != "null":
+                # Containers arrive as start_map/start_array with value None and fail the check too.
+                check(value, f"{path}.{prefix}")
+            yield prefix, event, value
 
-    # PageOfWorklogs
-    models.append(
-        f"""\
-@dataclass(frozen=True)
-class {page_worklogs_name}:
-    start_at: Optional[int]
-    max_results: Optional[int]
-    total: Optional[int]
-    worklogs: List[{worklog_name}]
-
-    @staticmethod
-    def from_dict(obj: Any, path: str) -> "{page_worklogs_name}":
-        raw = _expect_dict(obj, path)
-        start_at: Optional[int] = None
-        if raw.get("startAt") is not None:
-            start_at = _expect_int(raw.get("startAt"), f"{{path}}.startAt")
-        max_results: Optional[int] = None
-        if raw.get("maxResults") is not None:
-            max_results = _expect_int(raw.get("maxResults"), f"{{path}}.maxResults")
-        total: Optional[int] = None
-        if raw.get("total") is not None:
-            total = _expect_int(raw.get("total"), f"{{path}}.total")
-        worklogs_raw = raw.get("worklogs")
-        worklogs_list = _expect_list(worklogs_raw, f"{{path}}.worklogs") if worklogs_raw is not None else []
-        worklogs = [
-            {worklog_name}.from_dict(item, f"{{path}}.worklogs[{{idx}}]")
-            for idx, item in enumerate(worklogs_list)
-        ]
-        return {page_worklogs_name}(
-            start_at=start_at,
-            max_results=max_results,
-            total=total,
-            worklogs=worklogs,
-        )
+    try:
+        for idx, item in enumerate(ijson.items(events(), f"{key}.item")):
+            yield item, f"{items_path}[{idx}]"
+    except ijson.JSONError as exc:
+        raise SerializationError(f"Failed to parse JSON: {exc}") from exc
 
 """
-    )
 
-    return header + helpers + "\n".join(models)
+    models = [
+        _ModelSpec(
+            user_details_name,
+            (
+                _FieldSpec("account_id", "accountId", "str"),
+                _FieldSpec("display_name", "displayName", "str"),
+                _FieldSpec("email_address", "emailAddress", "str", default_none=True),
+            ),
+        ),
+        _ModelSpec(
+            project_name,
+            (
+                _FieldSpec("id", "id", "str", local="project_id"),
+                _FieldSpec("key", "key", "str"),
+                _FieldSpec("name", "name", "str"),
+                _FieldSpec("project_type_key", "projectTypeKey", "str", default_none=True),
+            ),
+        ),
+        _ModelSpec(
+            page_projects_name,
+            _page_fields(with_is_last=True) + (_FieldSpec("values", "values", "list", model=project_name),),
+            response=True,
+        ),
+        _ModelSpec(
+            issue_name,
+            (
+                _FieldSpec("id", "id", "str", local="issue_id"),
+                _FieldSpec("key", "key", "str"),
+                _FieldSpec("fields", "fields", "object"),
+            ),
+            inline_return=True,
+        ),
+        _ModelSpec(
+            search_results_name,
+            _page_fields(with_is_last=False) + (_FieldSpec("issues", "issues", "list", model=issue_name),),
+            response=True,
+        ),
+        _ModelSpec(
+            change_details_name,
+            (
+                _FieldSpec("field", "field", "str"),
+                _FieldSpec("from_value", "from", "str", default_none=True),
+                _FieldSpec("to_value", "to", "str", default_none=True),
+                _FieldSpec("from_string", "fromString", "str", default_none=True),
+                _FieldSpec("to_string", "toString", "str", default_none=True),
+            ),
+        ),
+        _ModelSpec(
+            changelog_name,
+            (
+                _FieldSpec("id", "id", "str", local="event_id"),
+                _FieldSpec("created", "created", "str"),
+                _FieldSpec("items", "items", "list", model=change_details_name),
+                _FieldSpec("author", "author", "model", model=user_details_name, default_none=True),
+            ),
+            parse_order=("id", "created", "author", "items"),
+        ),
+        _ModelSpec(
+            page_changelog_name,
+            _page_fields(with_is_last=True) + (_FieldSpec("values", "values", "list", model=changelog_name),),
+            response=True,
+        ),
+        _ModelSpec(
+            worklog_name,
+            (
+                _FieldSpec("id", "id", "str", local="worklog_id"),
+                _FieldSpec("started", "started", "str"),
+                _FieldSpec("time_spent_seconds", "timeSpentSeconds", "int"),
+                _FieldSpec("created", "created", "str"),
+                _FieldSpec("updated", "updated", "str"),
+                _FieldSpec("author", "author", "model", model=user_details_name, default_none=True),
+            ),
+        ),
+        _ModelSpec(
+            page_worklogs_name,
+            _page_fields(with_is_last=False) + (_FieldSpec("worklogs", "worklogs", "list", model=worklog_name),),
+            response=True,
+        ),
+    ]
+
+    return header + helpers + "\n".join(_render_model(model) for model in models)
 
 
 @dataclass(frozen=True)
@@ -627,10 +663,13 @@ def _parse_args() -> Args:
 
 def main() -> int:
     args = _parse_args()
-    doc = _read_json(args.spec)
+    doc = _load_spec_cached(args.spec)
     rendered = _generate(doc)
     args.out.parent.mkdir(parents=True, exist_ok=True)
-    args.out.write_text(rendered, encoding="utf-8")
+    if write_bytes_if_changed(args.out, rendered.encode("utf-8")):
+        print(f"Wrote {args.out}")
+    else:
+        print(f"Up to date: {args.out}")
     return 0
 
 
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import argparse
 import os
+import re
 import sys
 from pathlib import Path
 from typing import List, Optional
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus
 
 
 def _add_project_to_syspath() -> None:
@@ -22,13 +23,11 @@ from atlassian.oauth_3lo import (  # noqa: E402
 )
 
 
+_SCOPE_RE = re.compile(r"[^,\s]+")
+
+
 def _split_scopes(raw: str) -> List[str]:
-    parts: List[str] = []
-    for chunk in (raw or "").replace(",", " ").split():
-        v = chunk.strip()
-        if v:
-            parts.append(v)
-    return parts
+    return _SCOPE_RE.findall(raw or "")
 
 
 def _extract_code(user_input: str) -> str:
@@ -37,9 +36,14 @@ def _extract_code(user_input: str) -> str:
         raise ValueError("missing code/redirected URL input")
     if "://" not in raw:
         return raw
-    parsed = urlparse(raw)
-    qs = parse_qs(parsed.query)
-    code = qs.get("code", [None])[0]
+    # Scan the query pairs for the first non-empty code instead of building a parse_qs dict.
+    query = raw.partition("#")[0].partition("?")[2]
+    code = None
+    for pair in query.split("&"):
+        name, _, value = pair.partition("=")
+        if value and unquote_plus(name) == "code":
+            code = unquote_plus(value)
+            break
     if not code or not code.strip():
         raise ValueError("redirected URL missing ?code=")
     return code.strip()